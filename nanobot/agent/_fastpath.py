@@ -0,0 +1,104 @@
+"""Hot-path string helpers for the agent loop.
+
+These run on every message and every tool call. They are kept as small,
+fully-annotated pure functions in one module so they stay easy to
+profile and could be compiled (mypyc/Cython) later without touching the
+loop itself.
+"""
+
+import json
+import re
+
+# Matches Frappe session_id prefixes and captures the channel hash
+# up to the optional version/bot-name suffix.
+_FRAPPE_RE = re.compile(r"^(?:nanonet-messaging|nanonet-dm|nanonet-ctx):([^:]+)")
+
+# Per-tool argument summarizers (max 200 chars); one dict lookup on the
+# per-tool-call path instead of a chain of string compares, and the
+# json.dumps fallback only runs for unknown tools.
+_ARG_SUMMARIZERS = {
+    "exec": lambda a: (a.get("command", "") or "")[:180],
+    "read_file": lambda a: (a.get("path", "") or "")[:200],
+    "write_file": lambda a: (a.get("path", "") or "")[:200],
+    "edit_file": lambda a: (a.get("path", "") or "")[:200],
+    "web_search": lambda a: (a.get("query", "") or "")[:200],
+    "web_fetch": lambda a: (a.get("url", "") or "")[:200],
+    "message": lambda a: f"channel={a.get('channel', '')} text={(a.get('text', '') or '')[:100]}",
+}
+
+
+def extract_json_array(text: str) -> str | None:
+    """Extract the first top-level JSON array from text.
+
+    Single forward scan tracking bracket depth and string/escape state —
+    O(n) with no regex backtracking over long LLM responses.
+    """
+    start = text.find("[")
+    if start == -1:
+        return None
+    depth = 0
+    in_str = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_str:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_str = False
+        elif ch == '"':
+            in_str = True
+        elif ch == "[":
+            depth += 1
+        elif ch == "]":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
+def extract_frappe_channel(metadata: dict | None) -> str | None:
+    """Extract the Frappe Nanonet Channel name from message metadata.
+
+    The session_id follows these patterns:
+      nanonet-messaging:{channel}[:v{N}]
+      nanonet-dm:{channel}
+      nanonet-ctx:{channel}:{bot_name}
+
+    Returns None if the session_id is missing or doesn't match.
+    """
+    session_id = (metadata or {}).get("session_id", "")
+    if not session_id:
+        return None
+
+    # Single compiled-regex pass; the capture stops before any version
+    # suffix (:v2) or bot name suffix (:bot-name). Channel names are
+    # Frappe hashes (alphanumeric, ~10 chars).
+    m = _FRAPPE_RE.match(session_id)
+    return m.group(1) if m else None
+
+
+def summarize_args(tool_name: str, arguments: dict) -> str:
+    """Human-readable summary of tool arguments (max 200 chars)."""
+    fn = _ARG_SUMMARIZERS.get(tool_name)
+    if fn is not None:
+        return fn(arguments)
+    raw = json.dumps(arguments, ensure_ascii=False)
+    return raw[:200] + "..." if len(raw) > 200 else raw
+
+
+def summarize_outcome(result: str | None) -> str:
+    """Short summary of tool result (max 300 chars)."""
+    if not result:
+        return "OK: (empty)"
+    # Only the head matters here; never lowercase or line-split a
+    # potentially huge result.
+    is_error = result[:5].lower() == "error"
+    prefix = "ERROR: " if is_error else "OK: "
+    first_line = result[:320].split("\n", 1)[0].strip()
+    max_len = 300 - len(prefix)
+    if len(first_line) > max_len:
+        first_line = first_line[:max_len] + "..."
+    return prefix + first_line
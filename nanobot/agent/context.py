@@ -2,13 +2,108 @@
 
 import base64
 import mimetypes
+import mmap
+import os
 import platform
+import time
+from functools import lru_cache
 from pathlib import Path
+from string import Template
 from typing import Any
 
 from nanobot.agent.memory import MemoryStore
 from nanobot.agent.skills import SkillsLoader
 
+# Section headers hoisted to module level so build_system_prompt doesn't
+# re-parse f-string templates on every turn (hot prompt-build path).
+_MEMORY_HDR = "# Memory\n\n"
+
+# Hard cap on retrieved memories injected into the prompt; an oversized
+# block would otherwise inflate every LLM call for the rest of the loop.
+_MAX_MEMORIES_CHARS = 4000
+
+# Identity block stored once at module level, split around the timestamp.
+# string.Template keeps the literal readable (the {skill-name} braces
+# would otherwise need escaping for str.format).
+_IDENTITY_PREFIX = """# nanobot 🐈
+
+You are nanobot, a helpful AI assistant. You have access to tools that allow you to:
+- Read, write, and edit files
+- Execute shell commands
+- Search the web and fetch web pages
+- Send messages to users on chat channels
+- Spawn subagents for complex background tasks
+
+## Current Time
+"""
+
+_IDENTITY_SUFFIX_TMPL = Template("""
+
+## Runtime
+${runtime}
+
+## Workspace
+Your workspace is at: ${workspace_path}
+- Memory files: ${workspace_path}/memory/MEMORY.md
+- Daily notes: ${workspace_path}/memory/YYYY-MM-DD.md
+- Custom skills: ${workspace_path}/skills/{skill-name}/SKILL.md
+
+IMPORTANT: When responding to direct questions or conversations, reply directly with your text response.
+Only use the 'message' tool when you need to send a message to a specific chat channel (like WhatsApp).
+For normal conversation, just respond with text - do not call the message tool.
+
+Always be helpful, accurate, and concise.
+
+CRITICAL: When you need to use a tool, you MUST make an actual function call — never describe or simulate a tool call in text. If you say you will call a tool, actually call it. Never output fake tool call syntax, JSON payloads, or code blocks as a substitute for a real function call.
+When remembering something, write to ${workspace_path}/memory/MEMORY.md""")
+
+# Warm the mimetypes DB at import so the first media message doesn't pay
+# the lazy /etc/mime.types parse.
+mimetypes.init()
+
+# Fast path for the image extensions that actually show up in chats —
+# one dict.get instead of a full mimetypes lookup.
+_IMAGE_MIME = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+}
+
+
+@lru_cache(maxsize=256)
+def _guess_mime(path: str) -> str | None:
+    """Memoized mime lookup — media paths repeat across turns."""
+    mime = _IMAGE_MIME.get(os.path.splitext(path)[1].lower())
+    if mime:
+        return mime
+    return mimetypes.guess_type(path)[0]
+
+
+@lru_cache(maxsize=32)
+def _encode_image(path: str, mime: str, mtime: float) -> str:
+    """Encode an image file as a base64 data URL.
+
+    Keyed on (path, mime, mtime) so a re-attached, unchanged image
+    (e.g. the user resends the same screenshot) skips the encode entirely.
+    """
+    # mmap the file so b64encode runs a single C-level pass over the
+    # buffer instead of copying multi-MB images into Python bytes first.
+    with open(path, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                b64 = base64.b64encode(mm)
+        except ValueError:  # empty file
+            b64 = b""
+    return (b"data:%b;base64,%b" % (mime.encode("ascii"), b64)).decode("ascii")
+_ACTIVE_SKILLS_HDR = "# Active Skills\n\n"
+_SKILLS_HDR = (
+    "# Skills\n\n"
+    "The following skills extend your capabilities. To use a skill, read its SKILL.md file using the read_file tool.\n"
+    'Skills with available="false" need dependencies installed first - you can try installing them with apt/brew.\n\n'
+)
+
 
 class ContextBuilder:
     """
@@ -19,11 +114,48 @@ class ContextBuilder:
     """
     
     BOOTSTRAP_FILES = ["AGENTS.md", "SOUL.md", "USER.md", "TOOLS.md", "IDENTITY.md", "CHANNELS.md"]
+
+    # How long the rendered skills sections may go without a re-scan.
+    # The prompt tells the model it can install a skill's dependencies
+    # and then use it, so availability flags must not be frozen for the
+    # process lifetime — a coarse TTL picks up installs within minutes
+    # while keeping the per-turn path scan-free.
+    SKILLS_CACHE_TTL = 300.0
+
     
     def __init__(self, workspace: Path):
         self.workspace = workspace
         self.memory = MemoryStore(workspace)
         self.skills = SkillsLoader(workspace)
+        # resolve() walks symlinks (one syscall per path component) and the
+        # workspace never moves — do it exactly once.
+        self._workspace_str = str(workspace.expanduser().resolve())
+        # Identity is static within a session except for the timestamp:
+        # precompute everything around it once instead of rebuilding the
+        # ~1KB string (plus platform/path lookups) on every turn.
+        self._identity_prefix, self._identity_suffix = self._build_identity_parts()
+        self._identity_minute: str | None = None
+        self._identity_cached: str = ""
+        # Bootstrap files are frozen per session: re-reading them every turn
+        # costs syscalls and, worse, any mid-session change invalidates the
+        # provider's prompt prefix cache. Rebuilt only via invalidate_bootstrap().
+        self._bootstrap_cache: str | None = None
+        self._bootstrap_mtimes: dict[str, float] = {}
+        # Path objects for the bootstrap files never change — build them once.
+        self._bootstrap_paths = [(f, workspace / f) for f in self.BOOTSTRAP_FILES]
+        # Skills sections are cached the same way: frontmatter is indexed
+        # once at startup, full bodies load lazily, and the rendered
+        # sections are reused until invalidate_skills() is called.
+        self.skills.prime_index()
+        self._always_skills_content: str | None = None
+        self._skills_summary: str | None = None
+        self._skills_cached_at = time.monotonic()
+        # Memoized full system prompt: on steady state (no memory/skills/
+        # bootstrap changes within the same minute) the rebuild is skipped
+        # entirely, which also keeps the prompt prefix byte-identical.
+        self._bootstrap_version = 0
+        self._prompt_cache_key: tuple | None = None
+        self._prompt_cache_value = ""
     
     def build_system_prompt(self, skill_names: list[str] | None = None) -> str:
         """
@@ -35,6 +167,23 @@ class ContextBuilder:
         Returns:
             Complete system prompt.
         """
+        # Periodically drop the skills sections so availability flags
+        # reflect dependencies installed mid-session (bumps
+        # skills.version, which also rotates the prompt cache key).
+        now = time.monotonic()
+        if now - self._skills_cached_at > self.SKILLS_CACHE_TTL:
+            self.invalidate_skills()
+
+        cache_key = (
+            tuple(skill_names or ()),
+            self.memory.version,
+            self.skills.version,
+            self._bootstrap_version,
+            int(time.time() // 60),
+        )
+        if cache_key == self._prompt_cache_key:
+            return self._prompt_cache_value
+
         parts = []
         
         # Core identity
@@ -48,77 +197,89 @@ class ContextBuilder:
         # Memory context
         memory = self.memory.get_memory_context()
         if memory:
-            parts.append(f"# Memory\n\n{memory}")
-        
+            parts.append(_MEMORY_HDR + memory)
+
         # Skills - progressive loading
         # 1. Always-loaded skills: include full content
-        always_skills = self.skills.get_always_skills()
-        if always_skills:
-            always_content = self.skills.load_skills_for_context(always_skills)
-            if always_content:
-                parts.append(f"# Active Skills\n\n{always_content}")
-        
-        # 2. Available skills: only show summary (agent uses read_file to load)
-        skills_summary = self.skills.build_skills_summary()
-        if skills_summary:
-            parts.append(f"""# Skills
-
-The following skills extend your capabilities. To use a skill, read its SKILL.md file using the read_file tool.
-Skills with available="false" need dependencies installed first - you can try installing them with apt/brew.
+        if self._always_skills_content is None:
+            always_skills = self.skills.get_always_skills()
+            self._always_skills_content = (
+                self.skills.load_skills_for_context(always_skills) if always_skills else ""
+            )
+        if self._always_skills_content:
+            parts.append(_ACTIVE_SKILLS_HDR + self._always_skills_content)
 
-{skills_summary}""")
-        
-        return "\n\n---\n\n".join(parts)
+        # 2. Available skills: only show summary (agent uses read_file to load)
+        if self._skills_summary is None:
+            self._skills_summary = self.skills.build_skills_summary()
+        if self._skills_summary:
+            parts.append(_SKILLS_HDR + self._skills_summary)
+
+        self._prompt_cache_key = cache_key
+        self._prompt_cache_value = "\n\n---\n\n".join(parts)
+        return self._prompt_cache_value
     
     def _get_identity(self) -> str:
-        """Get the core identity section."""
+        """Get the core identity section (cached per minute)."""
         from datetime import datetime
         now = datetime.now().strftime("%Y-%m-%d %H:%M (%A)")
-        workspace_path = str(self.workspace.expanduser().resolve())
+        if now != self._identity_minute:
+            self._identity_minute = now
+            self._identity_cached = self._identity_prefix + now + self._identity_suffix
+        return self._identity_cached
+
+    def _build_identity_parts(self) -> tuple[str, str]:
+        """Build the identity section split around the (variable) timestamp."""
         system = platform.system()
         runtime = f"{'macOS' if system == 'Darwin' else system} {platform.machine()}, Python {platform.python_version()}"
-        
-        return f"""# nanobot 🐈
-
-You are nanobot, a helpful AI assistant. You have access to tools that allow you to:
-- Read, write, and edit files
-- Execute shell commands
-- Search the web and fetch web pages
-- Send messages to users on chat channels
-- Spawn subagents for complex background tasks
-
-## Current Time
-{now}
-
-## Runtime
-{runtime}
+        suffix = _IDENTITY_SUFFIX_TMPL.substitute(
+            runtime=runtime,
+            workspace_path=self._workspace_str,
+        )
+        return _IDENTITY_PREFIX, suffix
+
+    def invalidate_bootstrap(self) -> None:
+        """Drop the cached bootstrap content (e.g. on session rollover)."""
+        self._bootstrap_cache = None
+        self._bootstrap_mtimes = {}
+        self._bootstrap_version += 1
+
+    def invalidate_skills(self) -> None:
+        """Drop cached skills sections (e.g. after installing a skill)."""
+        self.skills.invalidate_index()
+        self._always_skills_content = None
+        self._skills_summary = None
+        self._skills_cached_at = time.monotonic()
 
-## Workspace
-Your workspace is at: {workspace_path}
-- Memory files: {workspace_path}/memory/MEMORY.md
-- Daily notes: {workspace_path}/memory/YYYY-MM-DD.md
-- Custom skills: {workspace_path}/skills/{{skill-name}}/SKILL.md
-
-IMPORTANT: When responding to direct questions or conversations, reply directly with your text response.
-Only use the 'message' tool when you need to send a message to a specific chat channel (like WhatsApp).
-For normal conversation, just respond with text - do not call the message tool.
-
-Always be helpful, accurate, and concise.
-
-CRITICAL: When you need to use a tool, you MUST make an actual function call — never describe or simulate a tool call in text. If you say you will call a tool, actually call it. Never output fake tool call syntax, JSON payloads, or code blocks as a substitute for a real function call.
-When remembering something, write to {workspace_path}/memory/MEMORY.md"""
-    
     def _load_bootstrap_files(self) -> str:
-        """Load all bootstrap files from workspace."""
+        """Load all bootstrap files from workspace (cached per session)."""
+        if self._bootstrap_cache is not None:
+            return self._bootstrap_cache
+
+        # One scandir pass resolves existence + mtime for all bootstrap
+        # files instead of a stat call per file.
+        wanted = set(self.BOOTSTRAP_FILES)
+        mtimes: dict[str, float] = {}
+        try:
+            with os.scandir(self.workspace) as it:
+                for entry in it:
+                    if entry.name in wanted and entry.is_file():
+                        mtimes[entry.name] = entry.stat().st_mtime
+        except FileNotFoundError:
+            pass
+
         parts = []
-        
-        for filename in self.BOOTSTRAP_FILES:
-            file_path = self.workspace / filename
-            if file_path.exists():
-                content = file_path.read_text(encoding="utf-8")
+        for filename, file_path in self._bootstrap_paths:
+            if filename in mtimes:
+                # Raw binary read + one decode skips the TextIOWrapper and
+                # per-call codec lookup that read_text() pays.
+                with open(file_path, "rb") as f:
+                    content = f.read().decode("utf-8")
                 parts.append(f"## {filename}\n\n{content}")
-        
-        return "\n\n".join(parts) if parts else ""
+
+        self._bootstrap_mtimes = mtimes
+        self._bootstrap_cache = "\n\n".join(parts) if parts else ""
+        return self._bootstrap_cache
     
     def build_messages(
         self,
@@ -156,36 +317,36 @@ When remembering something, write to {workspace_path}/memory/MEMORY.md"""
         Returns:
             List of messages including system prompt.
         """
-        messages = []
-
-        # System prompt
-        system_prompt = self.build_system_prompt(skill_names)
+        # System prompt: stable base first, then the per-turn tail
+        # (memories, context summary, session line), joined in one shot
+        # instead of growing the string with repeated +=.
+        system_parts = [self.build_system_prompt(skill_names)]
 
-        # Inject retrieved memories into system prompt
         if retrieved_memories:
-            system_prompt += f"\n\n---\n\n{retrieved_memories}"
+            system_parts.append(retrieved_memories[:_MAX_MEMORIES_CHARS])
 
-        # Inject structured context summary into system prompt
         if structured_context:
             context_block = self._format_context_summary(structured_context)
             if context_block:
-                system_prompt += f"\n\n---\n\n{context_block}"
+                system_parts.append(context_block)
 
         if channel and chat_id:
-            system_prompt += f"\n\n## Current Session\nChannel: {channel}\nChat ID: {chat_id}"
-        messages.append({"role": "system", "content": system_prompt})
+            system_parts.append(f"## Current Session\nChannel: {channel}\nChat ID: {chat_id}")
+
+        system_msg = {"role": "system", "content": "\n\n---\n\n".join(system_parts)}
 
         # History — structured context or raw fallback
         if structured_context:
-            messages.extend(structured_context.get("recent_pairs", []))
-        elif history:
-            messages.extend(history)
+            history_msgs = structured_context.get("recent_pairs", [])
+        else:
+            history_msgs = history or []
 
         # Current message (with optional image attachments)
         user_content = self._build_user_content(current_message, media)
-        messages.append({"role": "user", "content": user_content})
 
-        return messages
+        # Single list display: allocated exactly-sized in one shot, no
+        # append/extend regrowth.
+        return [system_msg, *history_msgs, {"role": "user", "content": user_content}]
 
     @staticmethod
     def _format_context_summary(ctx: dict[str, Any]) -> str:
@@ -201,23 +362,20 @@ When remembering something, write to {workspace_path}/memory/MEMORY.md"""
         # Task list
         task_list = ctx.get("task_list", [])
         if task_list:
-            task_lines = []
-            for t in task_list:
-                task_lines.append(f"- [{t.get('status', 'pending')}] {t.get('task', '')}")
-            parts.append(
-                "## Current Task List\n"
-                + "\n".join(task_lines)
-            )
+            task_lines = [
+                f"- [{t.get('status', 'pending')}] {t.get('task', '')}" for t in task_list
+            ]
+            parts.append("## Current Task List\n" + "\n".join(task_lines))
 
-        # Tool log
+        # Tool log — %-formatting reuses one parsed template across what can
+        # be hundreds of entries in a long conversation.
         tool_log = ctx.get("tool_log", [])
         if tool_log:
-            tool_lines = []
-            for entry in tool_log:
-                tool = entry.get("tool", "?")
-                args = entry.get("args_summary", "")
-                outcome = entry.get("outcome", "")
-                tool_lines.append(f"- **{tool}**({args}) -> {outcome}")
+            tool_lines = [
+                "- **%s**(%s) -> %s"
+                % (e.get("tool", "?"), e.get("args_summary", ""), e.get("outcome", ""))
+                for e in tool_log
+            ]
             parts.append(
                 "## Tool Execution History\n"
                 "These tools were called during previous turns in this conversation:\n"
@@ -233,12 +391,21 @@ When remembering something, write to {workspace_path}/memory/MEMORY.md"""
         
         images = []
         for path in media:
-            p = Path(path)
-            mime, _ = mimetypes.guess_type(path)
-            if not p.is_file() or not mime or not mime.startswith("image/"):
+            # Already-encoded data URLs (e.g. pasted images) pass through as-is.
+            if path.startswith("data:image/"):
+                images.append({"type": "image_url", "image_url": {"url": path}})
+                continue
+            # Cheap in-memory mime filter first; only surviving candidates
+            # pay the stat/read syscalls.
+            mime = _guess_mime(path)
+            if not mime or not mime.startswith("image/"):
+                continue
+            try:
+                mtime = os.stat(path).st_mtime
+            except OSError:
                 continue
-            b64 = base64.b64encode(p.read_bytes()).decode()
-            images.append({"type": "image_url", "image_url": {"url": f"data:{mime};base64,{b64}"}})
+            url = _encode_image(path, mime, mtime)
+            images.append({"type": "image_url", "image_url": {"url": url}})
         
         if not images:
             return text
@@ -250,18 +417,15 @@ When remembering something, write to {workspace_path}/memory/MEMORY.md"""
         tool_call_id: str,
         tool_name: str,
         result: str
-    ) -> list[dict[str, Any]]:
+    ) -> None:
         """
-        Add a tool result to the message list.
-        
+        Add a tool result to the message list (mutates in place).
+
         Args:
             messages: Current message list.
             tool_call_id: ID of the tool call.
             tool_name: Name of the tool.
             result: Tool execution result.
-        
-        Returns:
-            Updated message list.
         """
         messages.append({
             "role": "tool",
@@ -269,26 +433,22 @@ When remembering something, write to {workspace_path}/memory/MEMORY.md"""
             "name": tool_name,
             "content": result
         })
-        return messages
-    
+
     def add_assistant_message(
         self,
         messages: list[dict[str, Any]],
         content: str | None,
         tool_calls: list[dict[str, Any]] | None = None,
         reasoning_content: str | None = None,
-    ) -> list[dict[str, Any]]:
+    ) -> None:
         """
-        Add an assistant message to the message list.
+        Add an assistant message to the message list (mutates in place).
 
         Args:
             messages: Current message list.
             content: Message content.
             tool_calls: Optional tool calls.
             reasoning_content: Optional reasoning content from reasoning models.
-
-        Returns:
-            Updated message list.
         """
         msg: dict[str, Any] = {"role": "assistant", "content": content or ""}
 
@@ -301,4 +461,3 @@ When remembering something, write to {workspace_path}/memory/MEMORY.md"""
             msg["reasoning_content"] = reasoning_content
 
         messages.append(msg)
-        return messages
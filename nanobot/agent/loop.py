@@ -1,8 +1,11 @@
 """Agent loop: the core processing engine."""
 
 import asyncio
+import hashlib
 import json
-import re
+import os
+import time
+from collections import OrderedDict, deque
 from pathlib import Path
 from typing import Any
 
@@ -18,7 +21,28 @@ from nanobot.agent.tools.shell import ExecTool
 from nanobot.agent.tools.web import WebSearchTool, WebFetchTool
 from nanobot.agent.tools.message import MessageTool
 from nanobot.agent.tools.gateway import load_gateway_tools
+from nanobot.agent._fastpath import (
+    extract_frappe_channel,
+    extract_json_array,
+    summarize_args,
+    summarize_outcome,
+)
 from nanobot.session.manager import Session, SessionManager
+from nanobot.utils.helpers import json_dumps_bytes
+from nanobot.utils.http import aclose_shared_client, get_shared_client
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson ships with litellm
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+    _loads = json.loads
 
 
 class AgentLoop:
@@ -32,7 +56,14 @@ class AgentLoop:
     4. Executes tool calls
     5. Sends responses back
     """
-    
+
+    TASK_LIST_CACHE_SIZE = 128
+    TASK_LIST_CACHE_TTL = 300.0  # seconds
+    TASK_FLUSH_DELAY = 0.2  # debounce window for Frappe task-list syncs
+    DUMP_FLUSH_INTERVAL = 0.5  # seconds between debug-dump disk flushes
+    BG_TASKS_MAX = 512  # drop new task-list syncs past this backlog
+
+
     def __init__(
         self,
         bus: MessageBus,
@@ -71,7 +102,33 @@ class AgentLoop:
         self.subagents = None
         
         self._running = False
+        # Cache for the secondary task-list LLM call: identical exchanges
+        # (same tasks, user message, tool summaries, response head) resolve
+        # to the same task list, so skip the provider round trip.
+        self._task_list_cache: OrderedDict[str, tuple[float, list]] = OrderedDict()
+        # Non-critical work (webhooks, debug sends, session saves) runs as
+        # background tasks; strong refs prevent premature GC.
+        self._bg_tasks: set[asyncio.Task] = set()
+        # Debounced task-list syncs: latest snapshot per channel plus the
+        # pending flusher task that will POST it.
+        self._task_latest: dict[str, list] = {}
+        self._task_flush_tasks: dict[str, asyncio.Task] = {}
+        # Debug-dump buffer: _dump_llm_call only records the snapshot;
+        # the flusher writes the latest one to disk periodically.
+        self._last_dump: dict | None = None
+        self._dump_dirty = False
         self._register_default_tools()
+
+    def _spawn_bg(self, coro) -> None:
+        """Schedule non-critical work without blocking the reply path."""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+
+    async def _flush_bg(self) -> None:
+        """Wait for any pending background work (shutdown / direct calls)."""
+        if self._bg_tasks:
+            await asyncio.gather(*self._bg_tasks, return_exceptions=True)
     
     def _register_default_tools(self) -> None:
         """Register the default set of tools."""
@@ -93,9 +150,10 @@ class AgentLoop:
         self.tools.register(WebSearchTool(api_key=self.brave_api_key))
         self.tools.register(WebFetchTool())
         
-        # Message tool
-        message_tool = MessageTool(send_callback=self.bus.publish_outbound)
-        self.tools.register(message_tool)
+        # Message tool — keep a direct reference so the per-message
+        # context update skips the registry lookup + isinstance check.
+        self._message_tool = MessageTool(send_callback=self.bus.publish_outbound)
+        self.tools.register(self._message_tool)
         
         # Spawn tool (for subagents) — disabled
         # spawn_tool = SpawnTool(manager=self.subagents)
@@ -113,15 +171,23 @@ class AgentLoop:
         """Run the agent loop, processing messages from the bus."""
         self._running = True
         logger.info("Agent loop started")
+
+        dump_flusher = None
+        if self.debug_config.log_llm_context:
+            dump_flusher = asyncio.create_task(self._dump_flusher())
         
         while self._running:
             try:
-                # Wait for next message
-                msg = await asyncio.wait_for(
-                    self.bus.consume_inbound(),
-                    timeout=1.0
-                )
-                
+                # Fast path: drain an already-queued message without a
+                # scheduler round trip; fall back to the timed wait.
+                try:
+                    msg = self.bus.consume_inbound_nowait()
+                except asyncio.QueueEmpty:
+                    msg = await asyncio.wait_for(
+                        self.bus.consume_inbound(),
+                        timeout=1.0
+                    )
+
                 # Process it
                 try:
                     response = await self._process_message(msg)
@@ -143,6 +209,13 @@ class AgentLoop:
                     ))
             except asyncio.TimeoutError:
                 continue
+
+        # Drain pending background work before the loop exits
+        await self._flush_bg()
+        await self.sessions.flush_all()
+        if dump_flusher is not None:
+            await dump_flusher
+        await aclose_shared_client()
     
     def stop(self) -> None:
         """Stop the agent loop."""
@@ -164,8 +237,12 @@ class AgentLoop:
         if msg.channel == "system":
             return await self._process_system_message(msg)
         
-        preview = msg.content[:80] + "..." if len(msg.content) > 80 else msg.content
-        logger.info(f"Processing message from {msg.channel}:{msg.sender_id}: {preview}")
+        # Lazy formatting: the preview slice is only built if INFO is enabled
+        logger.opt(lazy=True).info(
+            "Processing message from {}: {}",
+            lambda: f"{msg.channel}:{msg.sender_id}",
+            lambda: msg.content[:80] + "..." if len(msg.content) > 80 else msg.content,
+        )
 
         # Use explicit session_id from metadata when available (e.g. API /chat
         # passes session_id for conversation continuity).  This is used for both
@@ -175,17 +252,15 @@ class AgentLoop:
         effective_session_key = msg.metadata.get("session_id") or msg.session_key
 
         # Emit user_message event
-        await self._emit_event("user_message",
+        self._spawn_bg(self._emit_event("user_message",
             session_key=effective_session_key, channel=msg.channel,
-            role="user", content=msg.content)
+            role="user", content=msg.content))
 
         # Get or create session
         session = self.sessions.get_or_create(effective_session_key)
 
         # Update tool contexts
-        message_tool = self.tools.get("message")
-        if isinstance(message_tool, MessageTool):
-            message_tool.set_context(msg.channel, msg.chat_id)
+        self._message_tool.set_context(msg.channel, msg.chat_id)
 
         # Build initial messages with structured context
         retrieved_memories = ""
@@ -204,19 +279,24 @@ class AgentLoop:
         final_content = None
         total_prompt_tokens = 0
         total_completion_tokens = 0
-        tool_actions: list[dict[str, str]] = []  # tool summaries for session storage
+        # Tool summaries for session storage; ring buffer keeps only the
+        # most recent entries so long loops stay bounded.
+        tool_actions: deque[dict[str, str]] = deque(maxlen=self.max_iterations)
 
         while iteration < self.max_iterations:
             iteration += 1
 
-            # Call LLM
+            # Call LLM — the session key doubles as the prompt-cache key so
+            # the stable prefix is reused across loop iterations.
             response = await self.provider.chat(
                 messages=messages,
                 tools=self.tools.get_definitions(),
-                model=self.model
+                model=self.model,
+                cache_key=effective_session_key,
             )
 
-            # Write debug dump of the LLM call if enabled
+            # Record debug dump of the LLM call if enabled (no I/O here;
+            # the flusher persists the latest snapshot periodically)
             self._dump_llm_call(messages, response, iteration)
 
             # Accumulate token usage from every LLM call
@@ -227,90 +307,99 @@ class AgentLoop:
             # Handle tool calls
             if response.has_tool_calls:
                 # Add assistant message with tool calls
+                # Serialize each tool call's arguments exactly once and
+                # reuse the string for the API echo, logging, and debug.
+                args_strs = {tc.id: _dumps(tc.arguments) for tc in response.tool_calls}
                 tool_call_dicts = [
                     {
                         "id": tc.id,
                         "type": "function",
                         "function": {
                             "name": tc.name,
-                            "arguments": json.dumps(tc.arguments)  # Must be JSON string
+                            "arguments": args_strs[tc.id]  # Must be JSON string
                         }
                     }
                     for tc in response.tool_calls
                 ]
-                messages = self.context.add_assistant_message(
+                self.context.add_assistant_message(
                     messages, response.content, tool_call_dicts,
                     reasoning_content=response.reasoning_content,
                 )
 
-                # Execute tools
-                for tool_call in response.tool_calls:
-                    args_str = json.dumps(tool_call.arguments, ensure_ascii=False)
-                    logger.info(f"Tool call: {tool_call.name}({args_str[:200]})")
+                # Execute tools (read-only runs execute concurrently)
+                results = await self._execute_tool_calls(response.tool_calls)
+                for tool_call, result in zip(response.tool_calls, results):
+                    args_str = args_strs[tool_call.id]
+                    logger.opt(lazy=True).info(
+                        "Tool call: {}", lambda: f"{tool_call.name}({args_str[:200]})"
+                    )
 
                     # Emit tool_call event
-                    await self._emit_event("tool_call",
+                    self._spawn_bg(self._emit_event("tool_call",
                         session_key=effective_session_key, channel=msg.channel,
                         role="tool", tool_name=tool_call.name,
-                        tool_arguments=args_str, model=self.model)
+                        tool_arguments=args_str, model=self.model))
 
-                    result = await self.tools.execute(tool_call.name, tool_call.arguments)
-                    messages = self.context.add_tool_result(
+                    self.context.add_tool_result(
                         messages, tool_call.id, tool_call.name, result
                     )
 
                     # Capture tool summary for session storage
                     tool_actions.append({
                         "tool": tool_call.name,
-                        "args_summary": self._summarize_args(tool_call.name, tool_call.arguments),
-                        "outcome": self._summarize_outcome(result),
+                        "args_summary": summarize_args(tool_call.name, tool_call.arguments),
+                        "outcome": summarize_outcome(result),
                     })
 
                     # Emit tool_result event
-                    await self._emit_event("tool_result",
+                    self._spawn_bg(self._emit_event("tool_result",
                         session_key=effective_session_key, channel=msg.channel,
                         role="tool", tool_name=tool_call.name,
-                        content=result[:5000] if result else "")
+                        content=result[:5000] if result else ""))
 
                     # Send debug message to channel if enabled
-                    await self._debug_tool_call(
+                    self._spawn_bg(self._debug_tool_call(
                         msg.channel, msg.chat_id,
                         tool_call.name, args_str, result
-                    )
+                    ))
             else:
                 # No tool calls, we're done
                 final_content = response.content
 
                 # Emit assistant_message event with token usage
                 usage = response.usage or {}
-                await self._emit_event("assistant_message",
+                self._spawn_bg(self._emit_event("assistant_message",
                     session_key=effective_session_key, channel=msg.channel,
                     role="assistant", content=final_content,
                     model=self.model,
                     prompt_tokens=usage.get("prompt_tokens", 0),
                     completion_tokens=usage.get("completion_tokens", 0),
-                    total_tokens=usage.get("total_tokens", 0))
+                    total_tokens=usage.get("total_tokens", 0)))
                 break
 
         if final_content is None:
             final_content = "I've completed processing but have no response to give."
 
-        # Log response preview
-        preview = final_content[:120] + "..." if len(final_content) > 120 else final_content
-        logger.info(f"Response to {msg.channel}:{msg.sender_id}: {preview}")
+        # Log response preview (lazy: skipped entirely below INFO)
+        logger.opt(lazy=True).info(
+            "Response to {}: {}",
+            lambda: f"{msg.channel}:{msg.sender_id}",
+            lambda: final_content[:120] + "..." if len(final_content) > 120 else final_content,
+        )
 
-        # Save to session (clean content without usage footer)
+        # Save to session (clean content without usage footer); the disk
+        # write happens off the reply path.
         session.add_message("user", msg.content)
-        session.add_message("assistant", final_content, tool_actions=tool_actions)
-        self.sessions.save(session)
+        session.add_message("assistant", final_content, tool_actions=list(tool_actions))
+        self._spawn_bg(asyncio.to_thread(self.sessions.save, session))
 
         # Update task list in the background — the secondary LLM call
         # produces data for the *next* turn, so it doesn't need to block
         # the current response.
-        frappe_channel = self._extract_frappe_channel(msg.metadata)
+        frappe_channel = extract_frappe_channel(msg.metadata)
         if frappe_channel:
             asyncio.create_task(
-                self._update_task_list_bg(session, msg.content, final_content, tool_actions, frappe_channel)
+                self._update_task_list_bg(session, msg.content, final_content, list(tool_actions), frappe_channel)
             )
 
         # Append token usage footer for display only (not saved to session)
@@ -329,6 +418,37 @@ class AgentLoop:
             content=display_content
         )
     
+    async def _execute_tool_calls(self, tool_calls: list) -> list[str]:
+        """Execute tool calls, overlapping consecutive read-only calls.
+
+        Runs of tools marked ``parallel_safe`` (reads, fetches) execute
+        concurrently via asyncio.gather; mutating tools stay strictly
+        sequential. Results come back in the original call order.
+        """
+        n = len(tool_calls)
+        results: list[str] = [""] * n
+        i = 0
+        while i < n:
+            tool = self.tools.get(tool_calls[i].name)
+            if tool is not None and tool.parallel_safe:
+                j = i + 1
+                while j < n:
+                    nxt = self.tools.get(tool_calls[j].name)
+                    if nxt is None or not nxt.parallel_safe:
+                        break
+                    j += 1
+                if j - i > 1:
+                    results[i:j] = await asyncio.gather(*(
+                        self.tools.execute(tc.name, tc.arguments)
+                        for tc in tool_calls[i:j]
+                    ))
+                    i = j
+                    continue
+            tc = tool_calls[i]
+            results[i] = await self.tools.execute(tc.name, tc.arguments)
+            i += 1
+        return results
+
     async def _emit_event(self, event_type: str, **kwargs) -> None:
         """Emit a webhook event if a webhook emitter is configured.
 
@@ -409,9 +529,7 @@ class AgentLoop:
         session = self.sessions.get_or_create(session_key)
         
         # Update tool contexts
-        message_tool = self.tools.get("message")
-        if isinstance(message_tool, MessageTool):
-            message_tool.set_context(origin_channel, origin_chat_id)
+        self._message_tool.set_context(origin_channel, origin_chat_id)
         
         # Build messages with structured context
         structured_ctx = session.get_structured_context()
@@ -425,7 +543,7 @@ class AgentLoop:
         # Agent loop (limited for announce handling)
         iteration = 0
         final_content = None
-        tool_actions: list[dict[str, str]] = []
+        tool_actions: deque[dict[str, str]] = deque(maxlen=self.max_iterations)
         
         while iteration < self.max_iterations:
             iteration += 1
@@ -433,45 +551,49 @@ class AgentLoop:
             response = await self.provider.chat(
                 messages=messages,
                 tools=self.tools.get_definitions(),
-                model=self.model
+                model=self.model,
+                cache_key=session_key,
             )
-            
+
             if response.has_tool_calls:
+                args_strs = {tc.id: _dumps(tc.arguments) for tc in response.tool_calls}
                 tool_call_dicts = [
                     {
                         "id": tc.id,
                         "type": "function",
                         "function": {
                             "name": tc.name,
-                            "arguments": json.dumps(tc.arguments)
+                            "arguments": args_strs[tc.id]
                         }
                     }
                     for tc in response.tool_calls
                 ]
-                messages = self.context.add_assistant_message(
+                self.context.add_assistant_message(
                     messages, response.content, tool_call_dicts,
                     reasoning_content=response.reasoning_content,
                 )
 
-                for tool_call in response.tool_calls:
-                    args_str = json.dumps(tool_call.arguments, ensure_ascii=False)
-                    logger.info(f"Tool call: {tool_call.name}({args_str[:200]})")
-                    result = await self.tools.execute(tool_call.name, tool_call.arguments)
-                    messages = self.context.add_tool_result(
+                results = await self._execute_tool_calls(response.tool_calls)
+                for tool_call, result in zip(response.tool_calls, results):
+                    args_str = args_strs[tool_call.id]
+                    logger.opt(lazy=True).info(
+                        "Tool call: {}", lambda: f"{tool_call.name}({args_str[:200]})"
+                    )
+                    self.context.add_tool_result(
                         messages, tool_call.id, tool_call.name, result
                     )
 
                     tool_actions.append({
                         "tool": tool_call.name,
-                        "args_summary": self._summarize_args(tool_call.name, tool_call.arguments),
-                        "outcome": self._summarize_outcome(result),
+                        "args_summary": summarize_args(tool_call.name, tool_call.arguments),
+                        "outcome": summarize_outcome(result),
                     })
 
                     # Send debug message to origin channel if enabled
-                    await self._debug_tool_call(
+                    self._spawn_bg(self._debug_tool_call(
                         origin_channel, origin_chat_id,
                         tool_call.name, args_str, result
-                    )
+                    ))
             else:
                 final_content = response.content
                 break
@@ -481,14 +603,14 @@ class AgentLoop:
         
         # Save to session (mark as system message in history)
         session.add_message("user", f"[System: {msg.sender_id}] {msg.content}")
-        session.add_message("assistant", final_content, tool_actions=tool_actions)
-        self.sessions.save(session)
+        session.add_message("assistant", final_content, tool_actions=list(tool_actions))
+        self._spawn_bg(asyncio.to_thread(self.sessions.save, session))
 
         # Update task list in the background (same as _process_message)
-        frappe_channel = self._extract_frappe_channel(msg.metadata)
+        frappe_channel = extract_frappe_channel(msg.metadata)
         if frappe_channel:
             asyncio.create_task(
-                self._update_task_list_bg(session, msg.content, final_content, tool_actions, frappe_channel)
+                self._update_task_list_bg(session, msg.content, final_content, list(tool_actions), frappe_channel)
             )
 
         return OutboundMessage(
@@ -524,65 +646,9 @@ class AgentLoop:
         )
         
         response = await self._process_message(msg)
+        await self._flush_bg()
         return response.content if response else ""
 
-    @staticmethod
-    def _extract_frappe_channel(metadata: dict) -> str | None:
-        """Extract the Frappe Nanonet Channel name from message metadata.
-
-        The session_id follows these patterns:
-          nanonet-messaging:{channel}[:v{N}]
-          nanonet-dm:{channel}
-          nanonet-ctx:{channel}:{bot_name}
-
-        Returns None if the session_id is missing or doesn't match.
-        """
-        session_id = (metadata or {}).get("session_id", "")
-        if not session_id:
-            return None
-
-        for prefix in ("nanonet-messaging:", "nanonet-dm:", "nanonet-ctx:"):
-            if session_id.startswith(prefix):
-                remainder = session_id[len(prefix):]
-                # Strip version suffix (:v2) or bot name suffix (:bot-name)
-                # Channel names are Frappe hashes (alphanumeric, ~10 chars)
-                parts = remainder.split(":")
-                if parts and parts[0]:
-                    return parts[0]
-
-        return None
-
-    @staticmethod
-    def _summarize_args(tool_name: str, arguments: dict) -> str:
-        """Human-readable summary of tool arguments (max 200 chars)."""
-        if tool_name == "exec":
-            return (arguments.get("command", "") or "")[:180]
-        if tool_name in ("read_file", "write_file", "edit_file"):
-            return (arguments.get("path", "") or "")[:200]
-        if tool_name == "web_search":
-            return (arguments.get("query", "") or "")[:200]
-        if tool_name == "web_fetch":
-            return (arguments.get("url", "") or "")[:200]
-        if tool_name == "message":
-            ch = arguments.get("channel", "")
-            txt = (arguments.get("text", "") or "")[:100]
-            return f"channel={ch} text={txt}"
-        raw = json.dumps(arguments, ensure_ascii=False)
-        return raw[:200] + "..." if len(raw) > 200 else raw
-
-    @staticmethod
-    def _summarize_outcome(result: str | None) -> str:
-        """Short summary of tool result (max 300 chars)."""
-        if not result:
-            return "OK: (empty)"
-        is_error = result.lower().startswith("error")
-        prefix = "ERROR: " if is_error else "OK: "
-        first_line = result.split("\n", 1)[0].strip()
-        max_len = 300 - len(prefix)
-        if len(first_line) > max_len:
-            first_line = first_line[:max_len] + "..."
-        return prefix + first_line
-
     async def _update_task_list_bg(
         self,
         session: Session,
@@ -611,9 +677,40 @@ class AgentLoop:
         1. Calls LLM to analyze the exchange and produce an updated task list
         2. Stores in session.metadata for context injection
         3. POSTs to Frappe API for messaging app display
+
+        Results are cached on a hash of the inputs so a repeated exchange
+        (retries, duplicate deliveries) skips the provider call.
         """
         current_tasks = session.metadata.get("task_list", [])
 
+        # Trivial turns (small talk: no tools, short reply, no open tasks)
+        # don't need a second LLM round trip at all.
+        if not tool_actions and len(assistant_response) < 160 and not current_tasks:
+            return
+
+        # Skip if this exact exchange was already processed for this session
+        # (retries, duplicate deliveries).
+        update_hash = hashlib.sha256(
+            (user_message + str(tool_actions)).encode()
+        ).hexdigest()
+        if session.metadata.get("last_task_update_hash") == update_hash:
+            return
+
+        cache_key = hashlib.sha256(json.dumps({
+            "tasks": current_tasks,
+            "user": user_message,
+            "tools": tool_actions,
+            "assistant": assistant_response[:500],
+        }, sort_keys=True).encode()).hexdigest()
+
+        cached = self._task_list_cache.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            self._task_list_cache.move_to_end(cache_key)
+            session.metadata["task_list"] = cached[1]
+            session.metadata["last_task_update_hash"] = update_hash
+            await self._post_task_list_to_frappe(channel, cached[1])
+            return
+
         if current_tasks:
             tasks_text = "\n".join(
                 f"- [{t['status']}] {t['task']}" for t in current_tasks
@@ -657,9 +754,9 @@ class AgentLoop:
             )
 
             text = response.content.strip()
-            json_match = re.search(r'\[.*\]', text, re.DOTALL)
-            if json_match:
-                task_list = json.loads(json_match.group())
+            json_text = extract_json_array(text)
+            if json_text:
+                task_list = _loads(json_text)
                 validated = []
                 for t in task_list[:10]:
                     if isinstance(t, dict) and "task" in t and "status" in t:
@@ -668,12 +765,22 @@ class AgentLoop:
                             "status": t["status"] if t["status"] in ("pending", "in_progress", "completed") else "pending",
                         })
                 session.metadata["task_list"] = validated
+                session.metadata["last_task_update_hash"] = update_hash
+                self._task_list_cache[cache_key] = (
+                    time.monotonic() + self.TASK_LIST_CACHE_TTL, validated
+                )
+                while len(self._task_list_cache) > self.TASK_LIST_CACHE_SIZE:
+                    self._task_list_cache.popitem(last=False)
                 await self._post_task_list_to_frappe(channel, validated)
         except Exception as e:
             logger.debug(f"Failed to update task list: {e}")
 
     async def _post_task_list_to_frappe(self, channel: str, task_list: list) -> None:
-        """POST the task list to Frappe API for messaging app display."""
+        """Queue a task-list sync to Frappe, debounced per channel.
+
+        Rapid churn within the debounce window coalesces into one POST
+        carrying the latest snapshot, instead of a request per update.
+        """
         if not self.webhook_emitter:
             return
 
@@ -681,33 +788,66 @@ class AgentLoop:
         if not hooks or not getattr(hooks, "webhook_url", None):
             return
 
-        # Derive task list URL from webhook URL base
-        # webhookUrl: https://site/api/method/nanonet.api.events.receive
-        base_url = hooks.webhook_url.rsplit("/", 1)[0]
-        url = f"{base_url}/nanonet.api.tasks.update_task_list"
+        if len(self._bg_tasks) > self.BG_TASKS_MAX:
+            logger.debug("Background task backlog full — dropping task-list sync")
+            return
 
-        try:
-            import httpx
-            async with httpx.AsyncClient(timeout=10.0, verify=False) as client:
+        self._task_latest[channel] = task_list
+        flusher = self._task_flush_tasks.get(channel)
+        if flusher is None or flusher.done():
+            task = asyncio.create_task(self._flush_task_list(channel))
+            self._task_flush_tasks[channel] = task
+            self._bg_tasks.add(task)
+            task.add_done_callback(self._bg_tasks.discard)
+
+    async def _flush_task_list(self, channel: str) -> None:
+        """Debounced flusher: POST snapshots until no new one arrives.
+
+        Loops so an update landing while a POST is in flight (when the
+        flusher can't be respawned) is still delivered — otherwise the
+        turn's final task list could sit unsent until some later update
+        happened to come in.
+        """
+        while True:
+            await asyncio.sleep(self.TASK_FLUSH_DELAY)
+            task_list = self._task_latest.pop(channel, None)
+            if task_list is None:
+                # Deregister before returning (no awaits in between, so
+                # this is atomic on the event loop): any later update
+                # finds no flusher entry and spawns a fresh one.
+                self._task_flush_tasks.pop(channel, None)
+                return
+
+            hooks = self.webhook_emitter.config
+
+            # Task-list URL precomputed on the emitter; fall back to deriving
+            # it from the configured webhook URL base
+            # (webhookUrl: https://site/api/method/nanonet.api.events.receive)
+            url = getattr(self.webhook_emitter, "tasks_update_url", "")
+            if not url:
+                url = hooks.webhook_url.rsplit("/", 1)[0] + "/nanonet.api.tasks.update_task_list"
+
+            try:
+                # Shared pooled client (keep-alive, verified TLS) — same one
+                # the gateway tools use.
+                client = get_shared_client()
                 await client.post(url, json={
                     "nanobot_token": hooks.nanobot_token,
                     "channel": channel,
                     "task_list": task_list,
                 }, headers={
                     "Authorization": hooks.webhook_auth,
-                })
-        except Exception as e:
-            logger.debug(f"Failed to sync task list to Frappe: {e}")
+                }, timeout=10.0)
+            except Exception as e:
+                logger.debug(f"Failed to sync task list to Frappe: {e}")
 
     def _dump_llm_call(self, messages: list[dict], response: Any, iteration: int) -> None:
-        """Write the last LLM request/response to a debug file.
-
-        Only writes when debug_config.log_llm_context is enabled.
-        The file is written to .debug/last_llm_call.json in the workspace
-        so the Frappe host can read it from the mounted volume.
+        """Record the last LLM request/response for the debug dump.
 
-        Overwrites on every call so it always reflects the most recent
-        LLM interaction (including mid-loop tool iterations).
+        Only assembles the dict — no I/O. The flusher started by run()
+        writes the latest snapshot to .debug/last_llm_call.json (mounted
+        volume read by the Frappe host) every DUMP_FLUSH_INTERVAL, so the
+        hot loop never pays serialization or disk cost per iteration.
         """
         if not self.debug_config.log_llm_context:
             return
@@ -715,35 +855,34 @@ class AgentLoop:
         try:
             from datetime import datetime
 
-            debug_dir = self.workspace / ".debug"
-            debug_dir.mkdir(parents=True, exist_ok=True)
-
-            # Separate system prompt from history and user message
-            system_prompt = None
-            history = []
-            user_message = None
-
-            for m in messages:
+            # Separate system prompt from history and user message.
+            # Single pass capturing indexes, then one history build —
+            # avoids the classify-then-reslice double copy.
+            sys_idx = user_idx = -1
+            for i, m in enumerate(messages):
                 role = m.get("role", "")
                 if role == "system":
-                    system_prompt = m.get("content", "")
+                    sys_idx = i
                 elif role == "user":
-                    user_message = m  # last one wins
-                    history.append(m)
-                else:
-                    history.append(m)
+                    user_idx = i  # last one wins
 
-            # Remove the system message and current user message from
-            # history for clarity (they're shown separately)
+            system_prompt = messages[sys_idx].get("content", "") if sys_idx >= 0 else None
+            user_message = messages[user_idx] if user_idx >= 0 else None
+
+            history = [m for i, m in enumerate(messages) if i != sys_idx]
+            # Drop the current user message from the tail for clarity
+            # (it's shown separately); mid-history user turns stay.
             if history and history[-1] is user_message:
-                history = history[:-1]
+                history.pop()
 
-            dump = {
+            self._last_dump = {
                 "timestamp": datetime.now().isoformat(),
                 "iteration": iteration,
                 "model": self.model,
                 "system_prompt": system_prompt,
-                "system_prompt_tokens": len(system_prompt.split()) if system_prompt else 0,
+                "system_prompt_tokens": (
+                    system_prompt.count(" ") + system_prompt.count("\n") + 1
+                ) if system_prompt else 0,
                 "history_message_count": len(history),
                 "history": history,
                 "user_message": user_message.get("content", "") if user_message else "",
@@ -757,8 +896,33 @@ class AgentLoop:
                     "usage": response.usage,
                 },
             }
+            self._dump_dirty = True
+        except Exception as e:
+            logger.debug(f"Failed to build LLM debug dump: {e}")
 
+    def _write_llm_dump(self) -> None:
+        """Write the latest dump snapshot atomically (runs in a thread)."""
+        dump = self._last_dump
+        if dump is None:
+            return
+        try:
+            debug_dir = self.workspace / ".debug"
+            debug_dir.mkdir(parents=True, exist_ok=True)
             dump_path = debug_dir / "last_llm_call.json"
-            dump_path.write_text(json.dumps(dump, indent=2, default=str))
+            tmp_path = debug_dir / "last_llm_call.json.tmp"
+            tmp_path.write_bytes(json_dumps_bytes(dump, default=str))
+            os.replace(tmp_path, dump_path)
         except Exception as e:
             logger.debug(f"Failed to write LLM debug dump: {e}")
+
+    async def _dump_flusher(self) -> None:
+        """Periodically flush dirty debug dumps off the event loop."""
+        while self._running:
+            await asyncio.sleep(self.DUMP_FLUSH_INTERVAL)
+            if self._dump_dirty:
+                self._dump_dirty = False
+                await asyncio.to_thread(self._write_llm_dump)
+        # Final flush so the last call survives shutdown
+        if self._dump_dirty:
+            self._dump_dirty = False
+            await asyncio.to_thread(self._write_llm_dump)
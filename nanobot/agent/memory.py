@@ -17,6 +17,8 @@ class MemoryStore:
         self.workspace = workspace
         self.memory_dir = ensure_dir(workspace / "memory")
         self.memory_file = self.memory_dir / "MEMORY.md"
+        # Bumped on every write so callers can key caches on memory state.
+        self.version = 0
     
     def get_today_file(self) -> Path:
         """Get path to today's memory file."""
@@ -42,6 +44,7 @@ class MemoryStore:
             content = header + content
         
         today_file.write_text(content, encoding="utf-8")
+        self.version += 1
     
     def read_long_term(self) -> str:
         """Read long-term memory (MEMORY.md)."""
@@ -52,6 +55,7 @@ class MemoryStore:
     def write_long_term(self, content: str) -> None:
         """Write to long-term memory (MEMORY.md)."""
         self.memory_file.write_text(content, encoding="utf-8")
+        self.version += 1
     
     def get_recent_memories(self, days: int = 7) -> str:
         """
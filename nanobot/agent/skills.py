@@ -25,7 +25,24 @@ class SkillsLoader:
         self.workspace = workspace
         self.workspace_skills = workspace / "skills"
         self.builtin_skills = builtin_skills_dir or BUILTIN_SKILLS_DIR
-    
+        self._meta_cache: dict[str, dict | None] = {}
+        # Bumped on invalidation so callers can key caches on skills state.
+        self.version = 0
+
+    def prime_index(self) -> None:
+        """Parse frontmatter metadata for all skills once.
+
+        Later metadata lookups become dict hits instead of full SKILL.md
+        reads. Full skill bodies are still loaded lazily on demand.
+        """
+        for s in self.list_skills(filter_unavailable=False):
+            self.get_skill_metadata(s["name"])
+
+    def invalidate_index(self) -> None:
+        """Drop cached metadata (e.g. after a skill is installed or edited)."""
+        self._meta_cache.clear()
+        self.version += 1
+
     def list_skills(self, filter_unavailable: bool = True) -> list[dict[str, str]]:
         """
         List all available skills.
@@ -213,11 +230,12 @@ class SkillsLoader:
         Returns:
             Metadata dict or None.
         """
+        if name in self._meta_cache:
+            return self._meta_cache[name]
+
+        metadata: dict | None = None
         content = self.load_skill(name)
-        if not content:
-            return None
-        
-        if content.startswith("---"):
+        if content and content.startswith("---"):
             match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
             if match:
                 # Simple YAML parsing
@@ -226,6 +244,6 @@ class SkillsLoader:
                     if ":" in line:
                         key, value = line.split(":", 1)
                         metadata[key.strip()] = value.strip().strip('"\'')
-                return metadata
-        
-        return None
+
+        self._meta_cache[name] = metadata
+        return metadata
@@ -11,7 +11,11 @@ class Tool(ABC):
     Tools are capabilities that the agent can use to interact with
     the environment, such as reading files, executing commands, etc.
     """
-    
+
+    # Read-only tools may set this True so the agent loop can run
+    # independent calls concurrently. Mutating tools stay sequential.
+    parallel_safe: bool = False
+
     _TYPE_MAP = {
         "string": str,
         "integer": int,
@@ -16,7 +16,9 @@ def _resolve_path(path: str, allowed_dir: Path | None = None) -> Path:
 
 class ReadFileTool(Tool):
     """Tool to read file contents."""
-    
+
+    parallel_safe = True
+
     def __init__(self, allowed_dir: Path | None = None):
         self._allowed_dir = allowed_dir
 
@@ -163,7 +165,9 @@ class EditFileTool(Tool):
 
 class ListDirTool(Tool):
     """Tool to list directory contents."""
-    
+
+    parallel_safe = True
+
     def __init__(self, allowed_dir: Path | None = None):
         self._allowed_dir = allowed_dir
 
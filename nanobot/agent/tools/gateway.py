@@ -5,7 +5,6 @@ so the LLM can invoke it directly. A companion CheckResultTool lets the
 LLM poll for approval outcomes.
 """
 
-import json
 from typing import Any
 
 import httpx
@@ -13,6 +12,8 @@ from loguru import logger
 
 from nanobot.agent.tools.base import Tool
 from nanobot.config.schema import SkillgateConfig
+from nanobot.utils.helpers import json_dumps_bytes, json_loads
+from nanobot.utils.http import get_shared_client
 
 
 class GatewayTool(Tool):
@@ -22,6 +23,10 @@ class GatewayTool(Tool):
     ``/api/method/skillgate.api.gateway.execute_tool`` and returns the result.
     """
 
+    # Cap what a gateway call can inject into the LLM context; oversized
+    # server payloads are truncated rather than re-encoded wholesale.
+    MAX_RESULT_CHARS = 8192
+
     def __init__(
         self,
         tool_name: str,
@@ -35,7 +40,13 @@ class GatewayTool(Tool):
         self._description = tool_description
         self._parameters = tool_parameters or {"type": "object", "properties": {}}
         self._site_url = site_url.rstrip("/")
-        self._auth = f"token {api_key}:{api_secret}"
+        self._url = f"{self._site_url}/api/method/skillgate.api.gateway.execute_tool"
+        # Request prep is on the per-tool-call hot path: build the
+        # headers dict and target URL once instead of per execute().
+        self._headers = {
+            "Authorization": f"token {api_key}:{api_secret}",
+            "Content-Type": "application/json",
+        }
 
     @property
     def name(self) -> str:
@@ -50,7 +61,6 @@ class GatewayTool(Tool):
         return self._parameters
 
     async def execute(self, **kwargs: Any) -> str:
-        url = f"{self._site_url}/api/method/skillgate.api.gateway.execute_tool"
         payload = {
             "tool_name": self._name,
             "params": kwargs,
@@ -58,37 +68,43 @@ class GatewayTool(Tool):
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.post(
-                    url,
-                    json=payload,
-                    headers={
-                        "Authorization": self._auth,
-                        "Content-Type": "application/json",
-                    },
-                    timeout=120.0,
-                )
-                resp.raise_for_status()
-
-            data = resp.json()
-            message = data.get("message", {})
+            client = get_shared_client()
+            # Pre-encode with the fast JSON helper (skips httpx's
+            # internal json pass) and decode straight from bytes.
+            resp = await client.post(
+                self._url,
+                content=json_dumps_bytes(payload),
+                headers=self._headers,
+                timeout=120.0,
+            )
+            resp.raise_for_status()
+
+            data = json_loads(resp.content)
+            message = data.get("message") or {}
 
             if isinstance(message, str):
                 return message
 
+            # Fetch the shared field once; branch on the common success
+            # case before the approval and fallback paths.
+            result = message.get("result")
+
+            if message.get("success"):
+                return str(result or "")[:self.MAX_RESULT_CHARS]
+
             if message.get("pending_approval"):
                 request_id = message.get("request_id", "")
-                hint = message.get("result", "This tool requires approval.")
+                hint = result or "This tool requires approval."
                 return (
                     f"{hint}\n\n"
                     f"Approval pending — request_id: {request_id}\n"
                     f"Use the check_approval_result tool with this request_id to poll for the outcome."
                 )
 
-            if message.get("success"):
-                return str(message.get("result", ""))
-
-            return str(message.get("result") or message.get("error") or json.dumps(message))
+            # Fallback: prefer fields we already have; pass the raw body
+            # through instead of re-encoding the decoded dict.
+            fallback = result or message.get("error") or resp.text
+            return str(fallback)[:self.MAX_RESULT_CHARS]
 
         except httpx.HTTPStatusError as e:
             logger.warning(f"Gateway tool {self._name} HTTP error: {e}")
@@ -103,7 +119,11 @@ class CheckApprovalResultTool(Tool):
 
     def __init__(self, site_url: str, api_key: str, api_secret: str):
         self._site_url = site_url.rstrip("/")
-        self._auth = f"token {api_key}:{api_secret}"
+        self._url = f"{self._site_url}/api/method/skillgate.api.gateway.check_result"
+        self._headers = {
+            "Authorization": f"token {api_key}:{api_secret}",
+            "Content-Type": "application/json",
+        }
 
     @property
     def name(self) -> str:
@@ -134,22 +154,17 @@ class CheckApprovalResultTool(Tool):
         if not request_id:
             return "Error: request_id is required."
 
-        url = f"{self._site_url}/api/method/skillgate.api.gateway.check_result"
-
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.post(
-                    url,
-                    json={"request_id": request_id, "format": "json"},
-                    headers={
-                        "Authorization": self._auth,
-                        "Content-Type": "application/json",
-                    },
-                    timeout=30.0,
-                )
-                resp.raise_for_status()
-
-            data = resp.json()
+            client = get_shared_client()
+            resp = await client.post(
+                self._url,
+                content=json_dumps_bytes({"request_id": request_id, "format": "json"}),
+                headers=self._headers,
+                timeout=30.0,
+            )
+            resp.raise_for_status()
+
+            data = json_loads(resp.content)
             message = data.get("message", {})
 
             if isinstance(message, str):
@@ -169,7 +184,7 @@ class CheckApprovalResultTool(Tool):
             elif status in ("Denied", "Expired"):
                 return f"Request {request_id} was {status.lower()}."
             else:
-                return json.dumps(message)
+                return json_dumps_bytes(message).decode()
 
         except httpx.HTTPStatusError as e:
             logger.warning(f"check_approval_result HTTP error: {e}")
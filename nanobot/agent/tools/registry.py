@@ -11,17 +11,25 @@ class ToolRegistry:
     
     Allows dynamic registration and execution of tools.
     """
-    
+
+    # Upper bound on a single tool result. A runaway shell command can
+    # return megabytes; bounding at the tool boundary keeps the oversized
+    # buffer out of the conversation, events, and session storage.
+    MAX_RESULT_CHARS = 65536
+
     def __init__(self):
         self._tools: dict[str, Tool] = {}
-    
+        self._definitions: list[dict[str, Any]] | None = None
+
     def register(self, tool: Tool) -> None:
         """Register a tool."""
         self._tools[tool.name] = tool
-    
+        self._definitions = None
+
     def unregister(self, name: str) -> None:
         """Unregister a tool by name."""
         self._tools.pop(name, None)
+        self._definitions = None
     
     def get(self, name: str) -> Tool | None:
         """Get a tool by name."""
@@ -32,8 +40,15 @@ class ToolRegistry:
         return name in self._tools
     
     def get_definitions(self) -> list[dict[str, Any]]:
-        """Get all tool definitions in OpenAI format."""
-        return [tool.to_schema() for tool in self._tools.values()]
+        """Get all tool definitions in OpenAI format (cached).
+
+        The tool set is static after registration, so the schema list is
+        built once and reused for every LLM call; (un)registering a tool
+        invalidates the cache.
+        """
+        if self._definitions is None:
+            self._definitions = [tool.to_schema() for tool in self._tools.values()]
+        return self._definitions
     
     async def execute(self, name: str, params: dict[str, Any]) -> str:
         """
@@ -57,7 +72,10 @@ class ToolRegistry:
             errors = tool.validate_params(params)
             if errors:
                 return f"Error: Invalid parameters for tool '{name}': " + "; ".join(errors)
-            return await tool.execute(**params)
+            result = await tool.execute(**params)
+            if len(result) > self.MAX_RESULT_CHARS:
+                result = result[:self.MAX_RESULT_CHARS] + "\n... [truncated]"
+            return result
         except Exception as e:
             return f"Error executing {name}: {str(e)}"
     
@@ -29,6 +29,14 @@ class MessageBus:
     async def consume_inbound(self) -> InboundMessage:
         """Consume the next inbound message (blocks until available)."""
         return await self.inbound.get()
+
+    def consume_inbound_nowait(self) -> InboundMessage:
+        """Consume an inbound message without awaiting.
+
+        Raises:
+            asyncio.QueueEmpty: If no message is pending.
+        """
+        return self.inbound.get_nowait()
     
     async def publish_outbound(self, msg: OutboundMessage) -> None:
         """Publish a response from the agent to channels."""
@@ -10,6 +10,15 @@ from nanobot.bus.events import InboundMessage, OutboundMessage
 from nanobot.bus.queue import MessageBus
 from nanobot.channels.base import BaseChannel
 from nanobot.config.schema import GatewayConfig
+from nanobot.utils.helpers import json_dumps_bytes, json_loads
+
+
+def _json_response(data: dict, status: int = 200) -> web.Response:
+    """json_response with the fast encoder (bytes out, no indent)."""
+    return web.Response(
+        body=json_dumps_bytes(data), status=status,
+        content_type="application/json",
+    )
 
 
 class ApiChannel(BaseChannel):
@@ -35,12 +44,16 @@ class ApiChannel(BaseChannel):
         self._app: web.Application | None = None
         self._runner: web.AppRunner | None = None
         self._pending: dict[str, asyncio.Future] = {}
+        # Created eagerly so a stop() racing server startup is never
+        # lost before start() begins waiting on it.
+        self._stop_event = asyncio.Event()
 
     async def start(self) -> None:
         """Start the HTTP API server."""
         self._running = True
 
-        self._app = web.Application()
+        # 1 MiB body cap — enforced by aiohttp before handlers run
+        self._app = web.Application(client_max_size=1 << 20)
         self._app.router.add_post("/chat", self._handle_chat)
         self._app.router.add_post("/notify", self._handle_notify)
         self._app.router.add_get("/health", self._handle_health)
@@ -59,13 +72,17 @@ class ApiChannel(BaseChannel):
             f"API channel listening on http://{self.config.host}:{self.config.port}"
         )
 
-        # Keep running until stopped
-        while self._running:
-            await asyncio.sleep(1)
+        # Block until stop() fires — no polling wakeups while idle.
+        # stop() may already have run during server startup; in that
+        # case the event is set (and _running False) and we fall
+        # straight through.
+        if self._running:
+            await self._stop_event.wait()
 
     async def stop(self) -> None:
         """Stop the HTTP API server."""
         self._running = False
+        self._stop_event.set()
 
         # Cancel any pending requests
         for req_id, future in self._pending.items():
@@ -101,10 +118,12 @@ class ApiChannel(BaseChannel):
             return
 
         future = self._pending.pop(msg.chat_id, None)
-        if future and not future.done():
+        if future is None:
+            # Request already timed out or was cancelled — expected under
+            # load, so keep it off the warning channel
+            logger.debug(f"No pending request for chat_id={msg.chat_id}")
+        elif not future.done():
             future.set_result(msg.content)
-        else:
-            logger.warning(f"No pending request for chat_id={msg.chat_id}")
 
     async def _handle_chat(self, request: web.Request) -> web.Response:
         """
@@ -117,24 +136,19 @@ class ApiChannel(BaseChannel):
             {"response": "Agent's reply...", "session_id": "..."}
         """
         try:
-            data = await request.json()
+            data = json_loads(await request.read())
         except Exception:
-            return web.json_response(
-                {"error": "Invalid JSON body"}, status=400
-            )
+            return _json_response({"error": "Invalid JSON body"}, status=400)
 
         message = data.get("message", "").strip()
         if not message:
-            return web.json_response(
-                {"error": "message field is required"}, status=400
-            )
+            return _json_response({"error": "message field is required"}, status=400)
 
         session_id = data.get("session_id", "api:default")
         request_id = f"api-{uuid.uuid4().hex[:12]}"
 
         # Create a Future that will be resolved when the agent responds
-        loop = asyncio.get_event_loop()
-        future: asyncio.Future = loop.create_future()
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
         self._pending[request_id] = future
 
         # Build metadata — merge caller-provided metadata (e.g. context_token
@@ -157,15 +171,11 @@ class ApiChannel(BaseChannel):
             response_text = await asyncio.wait_for(future, timeout=120.0)
         except asyncio.TimeoutError:
             self._pending.pop(request_id, None)
-            return web.json_response(
-                {"error": "Agent response timed out"}, status=504
-            )
+            return _json_response({"error": "Agent response timed out"}, status=504)
         except asyncio.CancelledError:
-            return web.json_response(
-                {"error": "Request cancelled"}, status=499
-            )
+            return _json_response({"error": "Request cancelled"}, status=499)
 
-        return web.json_response({
+        return _json_response({
             "response": response_text,
             "session_id": session_id,
         })
@@ -197,24 +207,18 @@ class ApiChannel(BaseChannel):
             {"status": "ok"}
         """
         try:
-            data = await request.json()
+            data = json_loads(await request.read())
         except Exception:
-            return web.json_response(
-                {"error": "Invalid JSON body"}, status=400
-            )
+            return _json_response({"error": "Invalid JSON body"}, status=400)
 
         message = data.get("message", "").strip()
         if not message:
-            return web.json_response(
-                {"error": "message field is required"}, status=400
-            )
+            return _json_response({"error": "message field is required"}, status=400)
 
         channel = data.get("channel", "").strip()
         chat_id = data.get("chat_id", "").strip()
         if not channel or not chat_id:
-            return web.json_response(
-                {"error": "channel and chat_id fields are required"}, status=400
-            )
+            return _json_response({"error": "channel and chat_id fields are required"}, status=400)
 
         # Publish directly to the bus with the target channel/chat_id.
         # This bypasses the API channel's own session — the agent will
@@ -234,11 +238,11 @@ class ApiChannel(BaseChannel):
             f"({len(message)} chars)"
         )
 
-        return web.json_response({"status": "ok"})
+        return _json_response({"status": "ok"})
 
     async def _handle_health(self, request: web.Request) -> web.Response:
         """Handle GET /health requests."""
-        return web.json_response({
+        return _json_response({
             "status": "ok",
             "channel": "api",
             "running": self._running,
@@ -18,7 +18,11 @@ class BaseChannel(ABC):
     """
     
     name: str = "base"
-    
+
+    # Keep channel instances __dict__-free where subclasses cooperate;
+    # subclasses that don't declare __slots__ still get a __dict__.
+    __slots__ = ("config", "bus", "_running")
+
     def __init__(self, config: Any, bus: MessageBus):
         """
         Initialize the channel.
@@ -1,12 +1,25 @@
 """Raven outbound channel — delivers messages directly to Raven via Frappe API."""
 
-import aiohttp
+import re
+
+import httpx
 from loguru import logger
 
 from nanobot.bus.events import OutboundMessage
 from nanobot.bus.queue import MessageBus
 from nanobot.channels.base import BaseChannel
 from nanobot.config.schema import RavenConfig
+from nanobot.utils.helpers import json_dumps_bytes
+
+# Non-whitespace probe: C-level scan instead of allocating a stripped
+# copy of (potentially tens-of-KB) tool output just to test emptiness.
+_NON_WS = re.compile(r"\S")
+
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
 
 
 class RavenChannel(BaseChannel):
@@ -23,9 +36,38 @@ class RavenChannel(BaseChannel):
 
     name = "raven"
 
+    __slots__ = ("_config", "_client", "_endpoint_url", "_base_headers")
+
     def __init__(self, config: RavenConfig, bus: MessageBus):
         super().__init__(config, bus)
         self._config = config
+        self._client: httpx.AsyncClient | None = None
+        # Endpoint and auth never change after construction — build them
+        # once so send() does no string assembly per message.
+        site_url = config.site_url.rstrip("/")
+        self._endpoint_url = (
+            f"{site_url}/api/method/raven.api.raven_message.send_message"
+            if site_url else ""
+        )
+        self._base_headers = {
+            "Authorization": f"token {config.api_key}:{config.api_secret}",
+            "Content-Type": "application/json",
+        }
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Lazily create the shared HTTP client (same pattern as WebhookEmitter).
+
+        One httpx client per channel means one DNS cache, connection pool
+        and TLS session for all deliveries; HTTP/2 (when h2 is installed)
+        lets concurrent sends share a single connection.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=60.0,
+                http2=_HTTP2,
+                limits=httpx.Limits(max_keepalive_connections=16),
+            )
+        return self._client
 
     async def start(self) -> None:
         """Mark as running (outbound-only, no listener)."""
@@ -37,6 +79,9 @@ class RavenChannel(BaseChannel):
 
     async def stop(self) -> None:
         self._running = False
+        if self._client:
+            await self._client.aclose()
+            self._client = None
         logger.info("Raven channel stopped")
 
     async def send(self, msg: OutboundMessage) -> None:
@@ -51,7 +96,7 @@ class RavenChannel(BaseChannel):
             return
 
         content = msg.content
-        if not content or not content.strip():
+        if not content or not _NON_WS.search(content):
             return
 
         # Resolve target channel
@@ -65,27 +110,22 @@ class RavenChannel(BaseChannel):
             logger.warning("Raven channel: no channel_id resolved, dropping message")
             return
 
-        site_url = self._config.site_url.rstrip("/")
-        url = f"{site_url}/api/method/raven.api.raven_message.send_message"
-        auth_header = f"token {self._config.api_key}:{self._config.api_secret}"
-
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url,
-                    json={
-                        "channel_id": channel_id,
-                        "text": content,
-                    },
-                    headers={"Authorization": auth_header},
-                    timeout=aiohttp.ClientTimeout(total=60),
-                ) as resp:
-                    if resp.status == 200:
-                        logger.info(f"Raven message delivered (channel={channel_id})")
-                    else:
-                        body = await resp.text()
-                        logger.warning(
-                            f"Raven delivery failed ({resp.status}): {body[:200]}"
-                        )
+            resp = await self._get_client().post(
+                self._endpoint_url,
+                content=json_dumps_bytes({
+                    "channel_id": channel_id,
+                    "text": content,
+                }),
+                headers=self._base_headers,
+            )
+            if resp.status_code == 200:
+                logger.info("Raven message delivered (channel={})", channel_id)
+            else:
+                # Lazy body slice: only decode resp.text if warnings are enabled
+                logger.opt(lazy=True).warning(
+                    "Raven delivery failed ({}): {}",
+                    lambda: resp.status_code, lambda: resp.text[:200],
+                )
         except Exception as e:
             logger.error(f"Raven delivery error: {e}")
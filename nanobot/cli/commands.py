@@ -9,6 +9,14 @@ from rich.table import Table
 
 from nanobot import __version__, __logo__
 
+# uvloop speeds up both the aiohttp server and httpx client paths;
+# purely optional — the stock loop is used when it isn't installed.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 app = typer.Typer(
     name="nanobot",
     help=f"{__logo__} nanobot - Personal AI Assistant",
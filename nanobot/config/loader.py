@@ -5,6 +5,12 @@ from pathlib import Path
 from typing import Any
 
 from nanobot.config.schema import Config
+from nanobot.utils.helpers import json_loads
+
+# Parsed configs keyed on (path, mtime_ns): repeated loads (multi-channel
+# startup, status commands) become a dict lookup instead of a fresh
+# JSON parse + pydantic validation.
+_CONFIG_CACHE: dict[tuple[str, int], Config] = {}
 
 
 def get_config_path() -> Path:
@@ -32,10 +38,15 @@ def load_config(config_path: Path | None = None) -> Config:
     
     if path.exists():
         try:
-            with open(path) as f:
-                data = json.load(f)
+            key = (str(path), path.stat().st_mtime_ns)
+            cached = _CONFIG_CACHE.get(key)
+            if cached is not None:
+                return cached
+            data = json_loads(path.read_bytes())
             data = _migrate_config(data)
-            return Config.model_validate(convert_keys(data))
+            config = Config.model_validate(convert_keys(data))
+            _CONFIG_CACHE[key] = config
+            return config
         except (json.JSONDecodeError, ValueError) as e:
             print(f"Warning: Failed to load config from {path}: {e}")
             print("Using default configuration.")
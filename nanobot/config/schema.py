@@ -1,12 +1,46 @@
 """Configuration schema using Pydantic."""
 
+from functools import lru_cache
 from pathlib import Path
-from pydantic import BaseModel, Field
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 from pydantic_settings import BaseSettings
 
+# Model-name keyword -> provider attribute (order matters: gateways first).
+# Compiled once at import instead of per get_provider() call.
+_KEYWORDS: tuple[tuple[str, str], ...] = (
+    ("aihubmix", "aihubmix"), ("openrouter", "openrouter"),
+    ("deepseek", "deepseek"), ("anthropic", "anthropic"), ("claude", "anthropic"),
+    ("openai", "openai"), ("gpt", "openai"), ("gemini", "gemini"),
+    ("zhipu", "zhipu"), ("glm", "zhipu"), ("zai", "zhipu"),
+    ("dashscope", "dashscope"), ("qwen", "dashscope"),
+    ("groq", "groq"), ("moonshot", "moonshot"), ("kimi", "moonshot"), ("vllm", "vllm"),
+)
+
+# Fallback scan order: gateways first (can serve any model), then specific providers.
+_FALLBACK_ORDER = ("openrouter", "aihubmix", "anthropic", "openai", "deepseek",
+                   "gemini", "zhipu", "dashscope", "moonshot", "vllm", "groq")
+
+
+@lru_cache(maxsize=64)
+def _resolve_provider_names(model_lower: str) -> tuple[str, ...]:
+    """Provider attribute names for every keyword found in the model name.
+
+    Keyword order is preserved (gateways first) and duplicates dropped,
+    so a string like "aihubmix/gpt-4o" yields ("aihubmix", "openai")
+    and the caller can fall through to the next match when a provider
+    has no key configured.
+    """
+    names: list[str] = []
+    for kw, name in _KEYWORDS:
+        if kw in model_lower and name not in names:
+            names.append(name)
+    return tuple(names)
+
 
 class WhatsAppConfig(BaseModel):
     """WhatsApp channel configuration."""
+    model_config = ConfigDict(frozen=True)
     enabled: bool = False
     bridge_url: str = "ws://localhost:3001"
     allow_from: list[str] = Field(default_factory=list)  # Allowed phone numbers
@@ -14,6 +48,7 @@ class WhatsAppConfig(BaseModel):
 
 class TelegramConfig(BaseModel):
     """Telegram channel configuration."""
+    model_config = ConfigDict(frozen=True)
     enabled: bool = False
     token: str = ""  # Bot token from @BotFather
     allow_from: list[str] = Field(default_factory=list)  # Allowed user IDs or usernames
@@ -22,6 +57,7 @@ class TelegramConfig(BaseModel):
 
 class FeishuConfig(BaseModel):
     """Feishu/Lark channel configuration using WebSocket long connection."""
+    model_config = ConfigDict(frozen=True)
     enabled: bool = False
     app_id: str = ""  # App ID from Feishu Open Platform
     app_secret: str = ""  # App Secret from Feishu Open Platform
@@ -32,6 +68,7 @@ class FeishuConfig(BaseModel):
 
 class DiscordConfig(BaseModel):
     """Discord channel configuration."""
+    model_config = ConfigDict(frozen=True)
     enabled: bool = False
     token: str = ""  # Bot token from Discord Developer Portal
     allow_from: list[str] = Field(default_factory=list)  # Allowed user IDs
@@ -41,6 +78,7 @@ class DiscordConfig(BaseModel):
 
 class RavenConfig(BaseModel):
     """Raven messaging channel configuration (direct API)."""
+    model_config = ConfigDict(frozen=True)
     enabled: bool = False
     site_url: str = ""           # e.g. "https://mysite.frappe.cloud"
     api_key: str = ""            # Nanobot user's Frappe API key
@@ -51,6 +89,7 @@ class RavenConfig(BaseModel):
 
 class ChannelsConfig(BaseModel):
     """Configuration for chat channels."""
+    model_config = ConfigDict(frozen=True)
     whatsapp: WhatsAppConfig = Field(default_factory=WhatsAppConfig)
     telegram: TelegramConfig = Field(default_factory=TelegramConfig)
     discord: DiscordConfig = Field(default_factory=DiscordConfig)
@@ -60,6 +99,7 @@ class ChannelsConfig(BaseModel):
 
 class AgentDefaults(BaseModel):
     """Default agent configuration."""
+    model_config = ConfigDict(frozen=True)
     workspace: str = "~/.nanobot/workspace"
     model: str = "anthropic/claude-opus-4-5"
     max_tokens: int = 8192
@@ -69,11 +109,13 @@ class AgentDefaults(BaseModel):
 
 class AgentsConfig(BaseModel):
     """Agent configuration."""
+    model_config = ConfigDict(frozen=True)
     defaults: AgentDefaults = Field(default_factory=AgentDefaults)
 
 
 class ProviderConfig(BaseModel):
     """LLM provider configuration."""
+    model_config = ConfigDict(frozen=True)
     api_key: str = ""
     api_base: str | None = None
     extra_headers: dict[str, str] | None = None  # Custom headers (e.g. APP-Code for AiHubMix)
@@ -81,6 +123,7 @@ class ProviderConfig(BaseModel):
 
 class ProvidersConfig(BaseModel):
     """Configuration for LLM providers."""
+    model_config = ConfigDict(frozen=True)
     anthropic: ProviderConfig = Field(default_factory=ProviderConfig)
     openai: ProviderConfig = Field(default_factory=ProviderConfig)
     openrouter: ProviderConfig = Field(default_factory=ProviderConfig)
@@ -96,28 +139,33 @@ class ProvidersConfig(BaseModel):
 
 class GatewayConfig(BaseModel):
     """Gateway/server configuration."""
+    model_config = ConfigDict(frozen=True)
     host: str = "0.0.0.0"
     port: int = 18790
 
 
 class WebSearchConfig(BaseModel):
     """Web search tool configuration."""
+    model_config = ConfigDict(frozen=True)
     api_key: str = ""  # Brave Search API key
     max_results: int = 5
 
 
 class WebToolsConfig(BaseModel):
     """Web tools configuration."""
+    model_config = ConfigDict(frozen=True)
     search: WebSearchConfig = Field(default_factory=WebSearchConfig)
 
 
 class ExecToolConfig(BaseModel):
     """Shell exec tool configuration."""
+    model_config = ConfigDict(frozen=True)
     timeout: int = 60
 
 
 class ToolsConfig(BaseModel):
     """Tools configuration."""
+    model_config = ConfigDict(frozen=True)
     web: WebToolsConfig = Field(default_factory=WebToolsConfig)
     exec: ExecToolConfig = Field(default_factory=ExecToolConfig)
     restrict_to_workspace: bool = False  # If true, restrict all tool access to workspace directory
@@ -125,6 +173,7 @@ class ToolsConfig(BaseModel):
 
 class HooksConfig(BaseModel):
     """Webhook hooks configuration for event capture."""
+    model_config = ConfigDict(frozen=True)
     webhook_url: str = ""  # URL to POST events to (e.g. Frappe events endpoint)
     webhook_auth: str = ""  # Authorization header value (e.g. "token api_key:api_secret")
     nanobot_token: str = ""  # Nanobot identity token for Layer 2 auth
@@ -132,11 +181,13 @@ class HooksConfig(BaseModel):
 
 class MemoryConfig(BaseModel):
     """Memory configuration (file-based on mounted volume)."""
+    model_config = ConfigDict(frozen=True)
     enabled: bool = True  # Default ON — file-based memory is free
 
 
 class SkillgateConfig(BaseModel):
     """Skillgate tool gateway configuration (direct API)."""
+    model_config = ConfigDict(frozen=True)
     enabled: bool = False
     url: str = ""                # Frappe site URL
     api_key: str = ""
@@ -172,26 +223,42 @@ class Config(BaseSettings):
     # Default base URLs for API gateways
     _GATEWAY_DEFAULTS = {"openrouter": "https://openrouter.ai/api/v1", "aihubmix": "https://aihubmix.com/v1"}
 
+    # Per-model (provider, api_base) resolution cache. Provider configs
+    # are frozen and env-loaded once, so entries never go stale within
+    # a process.
+    _resolved: dict = PrivateAttr(default_factory=dict)
+
+    def _resolve(self, model: str) -> tuple["ProviderConfig | None", str | None]:
+        """Resolve (provider, api_base) for a lowercased model name, memoized."""
+        entry = self._resolved.get(model)
+        if entry is not None:
+            return entry
+        p = self.providers
+        provider = None
+        for name in _resolve_provider_names(model):
+            candidate = getattr(p, name)
+            if candidate.api_key:
+                provider = candidate
+                break
+        if provider is None:
+            provider = next(
+                (pr for pr in (getattr(p, n) for n in _FALLBACK_ORDER) if pr.api_key),
+                None,
+            )
+        base = provider.api_base if provider else None
+        if base is None and provider is not None:
+            # Default URLs for known gateways (openrouter, aihubmix)
+            for gw_name, url in self._GATEWAY_DEFAULTS.items():
+                if provider == getattr(p, gw_name):
+                    base = url
+                    break
+        entry = (provider, base)
+        self._resolved[model] = entry
+        return entry
+
     def get_provider(self, model: str | None = None) -> ProviderConfig | None:
         """Get matched provider config (api_key, api_base, extra_headers). Falls back to first available."""
-        model = (model or self.agents.defaults.model).lower()
-        p = self.providers
-        # Keyword → provider mapping (order matters: gateways first)
-        keyword_map = {
-            "aihubmix": p.aihubmix, "openrouter": p.openrouter,
-            "deepseek": p.deepseek, "anthropic": p.anthropic, "claude": p.anthropic,
-            "openai": p.openai, "gpt": p.openai, "gemini": p.gemini,
-            "zhipu": p.zhipu, "glm": p.zhipu, "zai": p.zhipu,
-            "dashscope": p.dashscope, "qwen": p.dashscope,
-            "groq": p.groq, "moonshot": p.moonshot, "kimi": p.moonshot, "vllm": p.vllm,
-        }
-        for kw, provider in keyword_map.items():
-            if kw in model and provider.api_key:
-                return provider
-        # Fallback: gateways first (can serve any model), then specific providers
-        all_providers = [p.openrouter, p.aihubmix, p.anthropic, p.openai, p.deepseek,
-                         p.gemini, p.zhipu, p.dashscope, p.moonshot, p.vllm, p.groq]
-        return next((pr for pr in all_providers if pr.api_key), None)
+        return self._resolve((model or self.agents.defaults.model).lower())[0]
 
     def get_api_key(self, model: str | None = None) -> str | None:
         """Get API key for the given model. Falls back to first available key."""
@@ -200,14 +267,7 @@ class Config(BaseSettings):
     
     def get_api_base(self, model: str | None = None) -> str | None:
         """Get API base URL for the given model. Applies default URLs for known gateways."""
-        p = self.get_provider(model)
-        if p and p.api_base:
-            return p.api_base
-        # Default URLs for known gateways (openrouter, aihubmix)
-        for name, url in self._GATEWAY_DEFAULTS.items():
-            if p == getattr(self.providers, name):
-                return url
-        return None
+        return self._resolve((model or self.agents.defaults.model).lower())[1]
     
     class Config:
         env_prefix = "NANOBOT_"
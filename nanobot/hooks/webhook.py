@@ -8,11 +8,33 @@ logged at warning level so they're visible in normal logs.
 """
 
 import asyncio
-from datetime import datetime, timezone
+import time
 
-import httpx
 from loguru import logger
 
+from nanobot.utils.helpers import json_dumps_bytes
+from nanobot.utils.http import get_shared_client
+
+# Last formatted second, reused while the wall clock stays within it.
+# Event bursts share one strftime instead of a datetime + tzinfo round
+# trip per event.
+_last_second = 0
+_last_stamp = ""
+
+
+def _fast_utcnow(_time=time.time, _gmtime=time.gmtime, _strftime=time.strftime) -> str:
+    """UTC timestamp ("%Y-%m-%d %H:%M:%S") with per-second caching.
+
+    The time module functions are bound as default args so the per-call
+    lookups are LOAD_FAST instead of LOAD_GLOBAL + attribute access.
+    """
+    global _last_second, _last_stamp
+    secs = int(_time())
+    if secs != _last_second:
+        _last_second = secs
+        _last_stamp = _strftime("%Y-%m-%d %H:%M:%S", _gmtime(secs))
+    return _last_stamp
+
 
 class WebhookEmitter:
     """Async fire-and-forget HTTP client for webhook events.
@@ -26,20 +48,44 @@ class WebhookEmitter:
         nanobot_token: The nanobot's unique identity token.
     """
 
+    # "config" has no in-repo writer: integrations attach a task-list
+    # config to the emitter dynamically, and the agent loop gates the
+    # Frappe task-list sync on its presence — keep the slot so that
+    # assignment still works.
+    __slots__ = ("url", "auth", "nanobot_token", "tasks_update_url", "config",
+                 "_batch_prefix", "_background_tasks", "_queue", "_flusher")
+
+    FLUSH_WINDOW = 0.01  # seconds to wait for a burst to accumulate
+    MAX_BATCH = 64
+    # Ceiling on queued events while the receiver is slow; beyond this
+    # new events are dropped (with a warning) rather than growing memory
+    # and event-loop pressure unboundedly.
+    MAX_PENDING = 256
+
     def __init__(self, url: str, auth: str = "", nanobot_token: str = ""):
         self.url = url
         self.auth = auth
         self.nanobot_token = nanobot_token
-        self._client: httpx.AsyncClient | None = None
+        self.config = None
+        # Derived Frappe task-list endpoint (same API base as the webhook
+        # URL) — computed once instead of per POST.
+        self.tasks_update_url = (
+            url.rsplit("/", 1)[0] + "/nanonet.api.tasks.update_task_list"
+            if url else ""
+        )
+        # Static part of the batch envelope, serialized once; per-flush
+        # bodies are spliced as bytes instead of re-encoding these keys.
+        self._batch_prefix = (
+            json_dumps_bytes({"event_type": "batch", "nanobot_token": nanobot_token})[:-1]
+            + b',"events":'
+        )
         self._background_tasks: set[asyncio.Task] = set()
+        # Coalescing buffer: events emitted within the flush window are
+        # batched into one POST instead of one request each.
+        self._queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=self.MAX_PENDING)
+        self._flusher: asyncio.Task | None = None
 
-    def _get_client(self) -> httpx.AsyncClient:
-        """Lazily create the HTTP client."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(timeout=10.0, follow_redirects=True)
-        return self._client
-
-    async def emit(self, event_type: str, **kwargs) -> None:
+    async def emit(self, event_type: str, _utcnow=_fast_utcnow, **kwargs) -> None:
         """Emit an event to the webhook URL (fire-and-forget).
 
         Creates an asyncio task to POST the event so the caller
@@ -56,40 +102,80 @@ class WebhookEmitter:
         payload = {
             "event_type": event_type,
             "nanobot_token": self.nanobot_token,
-            "event_timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+            "event_timestamp": _utcnow(),
             **kwargs,
         }
 
         try:
-            task = asyncio.create_task(self._post(payload))
-            self._background_tasks.add(task)
-            task.add_done_callback(self._background_tasks.discard)
-        except Exception as e:
-            logger.warning(f"Failed to schedule webhook event: {e}")
+            self._queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            logger.warning("Webhook saturated ({} pending), dropping {}",
+                           self.MAX_PENDING, event_type)
+            return
 
-    async def _post(self, payload: dict) -> None:
-        """POST event payload to the webhook URL.
+        # No defensive try/except: create_task only raises when there is
+        # no running loop, i.e. the process is already shutting down.
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop())
+            self._background_tasks.add(self._flusher)
+            self._flusher.add_done_callback(self._background_tasks.discard)
+
+    async def _flush_loop(self) -> None:
+        """Drain the event queue, grouping bursts into single POSTs."""
+        while not self._queue.empty():
+            batch = [self._queue.get_nowait()]
+            # Let the rest of a burst (tool_call + tool_result +
+            # assistant_message, ...) land before flushing.
+            await asyncio.sleep(self.FLUSH_WINDOW)
+            while len(batch) < self.MAX_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            if len(batch) == 1:
+                # Single event keeps the original payload shape
+                await self._post(json_dumps_bytes(batch[0]), batch[0]["event_type"])
+            else:
+                await self._post(
+                    self._batch_prefix + json_dumps_bytes(batch) + b"}", "batch"
+                )
+
+    async def _post(self, body: bytes, event_type: str) -> None:
+        """POST a pre-serialized event body to the webhook URL.
 
         Args:
-            payload: The event data to send.
+            body: JSON-encoded request body.
+            event_type: Event type, used only for log messages.
         """
-        event_type = payload.get("event_type", "unknown")
         try:
             headers = {"Content-Type": "application/json"}
             if self.auth:
                 headers["Authorization"] = self.auth
-            client = self._get_client()
-            resp = await client.post(self.url, json=payload, headers=headers)
-            if resp.status_code >= 300:
-                logger.warning(f"Webhook POST {event_type} returned {resp.status_code}: {resp.text[:200]}")
-            else:
-                logger.debug(f"Webhook event {event_type} sent OK ({resp.status_code})")
+            # Process-shared client; the 10 s deadline and redirect
+            # policy ride on the request instead of a private pool.
+            # Stream the response so the common success path never
+            # buffers or decodes the body — only the status code
+            # matters there.
+            async with get_shared_client().stream(
+                "POST", self.url, content=body, headers=headers,
+                timeout=10.0, follow_redirects=True,
+            ) as resp:
+                if resp.status_code >= 300:
+                    body = (await resp.aread())[:200].decode("utf-8", "replace")
+                    logger.warning(
+                        "Webhook POST {} returned {}: {}",
+                        event_type, resp.status_code, body,
+                    )
+                else:
+                    logger.debug(
+                        "Webhook event {} sent OK ({})", event_type, resp.status_code
+                    )
         except Exception as e:
             logger.warning(f"Webhook POST {event_type} failed: {e}")
 
     async def close(self) -> None:
-        """Close the underlying HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Flush pending events (the shared HTTP client is closed at
+        process shutdown, not here)."""
+        if self._flusher is not None and not self._flusher.done():
+            await self._flusher
 
@@ -48,17 +48,21 @@ class LLMProvider(ABC):
         model: str | None = None,
         max_tokens: int = 4096,
         temperature: float = 0.7,
+        cache_key: str | None = None,
     ) -> LLMResponse:
         """
         Send a chat completion request.
-        
+
         Args:
             messages: List of message dicts with 'role' and 'content'.
             tools: Optional list of tool definitions.
             model: Model identifier (provider-specific).
             max_tokens: Maximum tokens in response.
             temperature: Sampling temperature.
-        
+            cache_key: Optional stable key (e.g. session key) so providers
+                that support prompt caching can reuse the shared prefix
+                across iterations.
+
         Returns:
             LLMResponse with content and/or tool calls.
         """
@@ -83,17 +83,19 @@ class LiteLLMProvider(LLMProvider):
         model: str | None = None,
         max_tokens: int = 4096,
         temperature: float = 0.7,
+        cache_key: str | None = None,
     ) -> LLMResponse:
         """
         Send a chat completion request via LiteLLM.
-        
+
         Args:
             messages: List of message dicts with 'role' and 'content'.
             tools: Optional list of tool definitions in OpenAI format.
             model: Model identifier (e.g., 'anthropic/claude-sonnet-4-5').
             max_tokens: Maximum tokens in response.
             temperature: Sampling temperature.
-        
+            cache_key: Optional stable key for provider-side prompt caching.
+
         Returns:
             LLMResponse with content and/or tool calls.
         """
@@ -148,6 +150,14 @@ class LiteLLMProvider(LLMProvider):
         if tools:
             kwargs["tools"] = tools
             kwargs["tool_choice"] = "auto"
+
+        # Stable prompt-cache key: lets providers that support server-side
+        # prompt caching (e.g. OpenAI) reuse the shared prefix across the
+        # tool-calling loop. drop_params lets LiteLLM strip it for
+        # providers that don't understand it.
+        if cache_key:
+            kwargs["prompt_cache_key"] = cache_key
+            kwargs["drop_params"] = True
         
         try:
             response = await acompletion(**kwargs)
@@ -1,6 +1,10 @@
 """Session management for conversation history."""
 
-import json
+import asyncio
+import os
+import threading
+from collections import OrderedDict, deque
+from operator import itemgetter
 from pathlib import Path
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -8,10 +12,10 @@ from typing import Any
 
 from loguru import logger
 
-from nanobot.utils.helpers import ensure_dir, safe_filename
+from nanobot.utils.helpers import ensure_dir, json_dumps_bytes, json_loads, safe_filename
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Session:
     """
     A conversation session.
@@ -19,22 +23,55 @@ class Session:
     Stores messages in JSONL format for easy reading and persistence.
     """
     
+    # In-memory cap on history; older messages are evicted from memory
+    # but remain in the on-disk JSONL (append-only), which acts as the
+    # cold archive.
+    MAX_MESSAGES = 500
+
     key: str  # channel:chat_id
     messages: list[dict[str, Any]] = field(default_factory=list)
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
     metadata: dict[str, Any] = field(default_factory=dict)
+    # How many leading messages are already on disk; save() appends
+    # only the tail past this point.
+    _persisted_count: int = 0
+    # Memoized get_history result: ((len(messages), max_messages), list).
+    _history_cache: tuple[tuple[int, int], list[dict[str, Any]]] | None = None
+    # (user_idx, assistant_idx) of every exchange, maintained
+    # incrementally so context builds never re-scan the history.
+    _pair_indices: list[tuple[int, int]] = field(default_factory=list)
     
     def add_message(self, role: str, content: str, **kwargs: Any) -> None:
         """Add a message to the session."""
+        now = datetime.now()
         msg = {
             "role": role,
             "content": content,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
+            # Pre-parsed epoch so context builds compare floats instead
+            # of re-parsing the ISO string on every call.
+            "_ts_epoch": now.timestamp(),
             **kwargs
         }
         self.messages.append(msg)
-        self.updated_at = datetime.now()
+        n = len(self.messages)
+        if role == "assistant" and n >= 2 and self.messages[-2]["role"] == "user":
+            self._pair_indices.append((n - 2, n - 1))
+        overflow = n - self.MAX_MESSAGES
+        if overflow > 0:
+            # Only evict messages that are already on disk so nothing
+            # is lost between saves.
+            evict = min(overflow, self._persisted_count)
+            if evict:
+                del self.messages[:evict]
+                self._persisted_count -= evict
+                self._pair_indices = [
+                    (u - evict, a - evict)
+                    for u, a in self._pair_indices if u >= evict
+                ]
+        self.updated_at = now
+        self._history_cache = None
     
     def get_history(self, max_messages: int = 50) -> list[dict[str, Any]]:
         """
@@ -46,11 +83,21 @@ class Session:
         Returns:
             List of messages in LLM format.
         """
+        # Messages only change through add_message/clear (which
+        # invalidate), so repeat calls within a turn are a cache hit.
+        cache_key = (len(self.messages), max_messages)
+        if self._history_cache is not None and self._history_cache[0] == cache_key:
+            return self._history_cache[1]
+
         # Get recent messages
         recent = self.messages[-max_messages:] if len(self.messages) > max_messages else self.messages
-        
-        # Convert to LLM format (just role and content)
-        return [{"role": m["role"], "content": m["content"]} for m in recent]
+
+        # Convert to LLM format (just role and content); itemgetter
+        # pulls both fields in one C-level call per message.
+        get = itemgetter("role", "content")
+        result = [{"role": r, "content": c} for r, c in map(get, recent)]
+        self._history_cache = (cache_key, result)
+        return result
     
     def get_structured_context(
         self,
@@ -88,30 +135,33 @@ class Session:
         from datetime import timedelta
 
         cutoff = datetime.now() - timedelta(minutes=recency_minutes)
+        cutoff_epoch = cutoff.timestamp()
 
-        # --- Collect candidate pairs walking backwards ---
-        all_pairs: list[tuple[int, int, dict, dict]] = []  # (user_idx, asst_idx, user_msg, asst_msg)
-        idx = len(self.messages) - 1
-        while idx >= 0 and len(all_pairs) < max_pairs:
-            m = self.messages[idx]
-            if m["role"] == "assistant" and idx > 0 and self.messages[idx - 1]["role"] == "user":
-                all_pairs.append((idx - 1, idx, self.messages[idx - 1], m))
-                idx -= 2
-            else:
-                idx -= 1
+        # --- Candidate pairs from the incrementally maintained index ---
+        # Newest first, capped at max_pairs; no history scan.
+        all_pairs: list[tuple[int, int, dict, dict]] = [  # (user_idx, asst_idx, user_msg, asst_msg)
+            (u, a, self.messages[u], self.messages[a])
+            for u, a in reversed(self._pair_indices[-max_pairs:])
+        ]
 
         # Determine how many to keep: at least min_pairs, plus any within the time window
         keep = min(min_pairs, len(all_pairs))
         for i in range(keep, len(all_pairs)):
-            ts = all_pairs[i][3].get("timestamp") or all_pairs[i][2].get("timestamp")
-            if ts:
-                try:
-                    msg_time = datetime.fromisoformat(ts)
-                    if msg_time >= cutoff:
-                        keep = i + 1
-                        continue
-                except (ValueError, TypeError):
-                    pass
+            epoch = all_pairs[i][3].get("_ts_epoch") or all_pairs[i][2].get("_ts_epoch")
+            if epoch is not None:
+                if epoch >= cutoff_epoch:
+                    keep = i + 1
+                    continue
+            else:
+                # Pre-epoch sessions: fall back to parsing the ISO string
+                ts = all_pairs[i][3].get("timestamp") or all_pairs[i][2].get("timestamp")
+                if ts:
+                    try:
+                        if datetime.fromisoformat(ts) >= cutoff:
+                            keep = i + 1
+                            continue
+                    except (ValueError, TypeError):
+                        pass
             break  # Once we hit a pair outside the window, stop
 
         selected = all_pairs[:keep]
@@ -122,20 +172,20 @@ class Session:
             recent.append({"role": "user", "content": user_m["content"]})
             recent.append({"role": "assistant", "content": asst_m["content"]})
 
-        # Indices of messages included in recent pairs (to exclude from older context)
-        recent_indices: set[int] = set()
-        for ui, ai, _u, _a in selected:
-            recent_indices.add(ui)
-            recent_indices.add(ai)
+        # Selected pairs are the contiguous tail of the walk, so older
+        # context is simply everything before the first selected index —
+        # no per-message set membership test needed.
+        first_recent_idx = selected[0][0] if selected else len(self.messages)
 
         # --- Task list (LLM-maintained, from session metadata) ---
         task_list = self.metadata.get("task_list", [])
 
         # --- Tool log (from tool_actions stored on older assistant messages) ---
-        tool_entries: list[dict[str, str]] = []
-        for i, m in enumerate(self.messages):
-            if i in recent_indices:
-                continue
+        # deque(maxlen=...) keeps only the newest entries as the sweep
+        # runs, replacing the build-everything-then-slice pattern.
+        tool_entries: deque[dict[str, str]] = deque(maxlen=max_tool_entries)
+        for i in range(first_recent_idx):
+            m = self.messages[i]
             if m["role"] != "assistant":
                 continue
             for action in m.get("tool_actions", []):
@@ -145,18 +195,22 @@ class Session:
                     "args_summary": action.get("args_summary", ""),
                     "outcome": action.get("outcome", ""),
                 })
-        tool_entries = tool_entries[-max_tool_entries:]
 
         return {
             "recent_pairs": recent,
             "task_list": task_list,
-            "tool_log": tool_entries,
+            "tool_log": list(tool_entries),
         }
 
     def clear(self) -> None:
         """Clear all messages in the session."""
         self.messages = []
         self.metadata = {}
+        self._history_cache = None
+        self._pair_indices = []
+        # Nothing in memory is on disk anymore; force the next save to
+        # do a full rewrite even if new messages arrive first.
+        self._persisted_count = 0
         self.updated_at = datetime.now()
 
 
@@ -166,16 +220,43 @@ class SessionManager:
     
     Sessions are stored as JSONL files in the sessions directory.
     """
-    
+
+    # Max sessions kept in memory; least-recently-used ones are flushed
+    # to disk and dropped so RSS tracks active chats, not total chats.
+    CACHE_SIZE = 64
+
     def __init__(self, workspace: Path):
         self.workspace = workspace
         self.sessions_dir = ensure_dir(Path.home() / ".nanobot" / "sessions")
-        self._cache: dict[str, Session] = {}
+        self._cache: OrderedDict[str, Session] = OrderedDict()
+        # key -> (jsonl path, sidecar path); safe_filename regex-scrubs
+        # the key, so resolve each distinct key once.
+        self._path_cache: dict[str, tuple[Path, Path]] = {}
+        # Per-session write locks: saves run both on worker threads
+        # (to_thread / flush_all) and on the event-loop thread (LRU
+        # eviction), and two concurrent appends of the same tail would
+        # duplicate messages in the JSONL.
+        self._write_locks: dict[str, threading.Lock] = {}
     
+    def _get_paths(self, key: str) -> tuple[Path, Path]:
+        """Get the (jsonl, metadata sidecar) paths for a session, memoized."""
+        paths = self._path_cache.get(key)
+        if paths is None:
+            safe_key = safe_filename(key.replace(":", "_"))
+            paths = (
+                self.sessions_dir / f"{safe_key}.jsonl",
+                self.sessions_dir / f"{safe_key}.meta.json",
+            )
+            self._path_cache[key] = paths
+        return paths
+
     def _get_session_path(self, key: str) -> Path:
         """Get the file path for a session."""
-        safe_key = safe_filename(key.replace(":", "_"))
-        return self.sessions_dir / f"{safe_key}.jsonl"
+        return self._get_paths(key)[0]
+
+    def _get_meta_path(self, key: str) -> Path:
+        """Get the metadata sidecar path for a session."""
+        return self._get_paths(key)[1]
     
     def get_or_create(self, key: str) -> Session:
         """
@@ -188,16 +269,26 @@ class SessionManager:
             The session.
         """
         # Check cache
-        if key in self._cache:
-            return self._cache[key]
-        
+        session = self._cache.get(key)
+        if session is not None:
+            self._cache.move_to_end(key)
+            return session
+
         # Try to load from disk
         session = self._load(key)
         if session is None:
             session = Session(key=key)
-        
-        self._cache[key] = session
+
+        self._put(key, session)
         return session
+
+    def _put(self, key: str, session: Session) -> None:
+        """Insert into the LRU cache, flushing and evicting the oldest."""
+        self._cache[key] = session
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.CACHE_SIZE:
+            _, evicted = self._cache.popitem(last=False)
+            self._write(evicted)
     
     def _load(self, key: str) -> Session | None:
         """Load a session from disk."""
@@ -210,51 +301,145 @@ class SessionManager:
             messages = []
             metadata = {}
             created_at = None
-            
-            with open(path) as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    data = json.loads(line)
+
+            # Metadata sidecar (written by append-only save); legacy
+            # files keep it inline as the first JSONL line instead.
+            meta_path = self._get_meta_path(key)
+            if meta_path.exists():
+                meta = json_loads(meta_path.read_bytes())
+                metadata = meta.get("metadata", {})
+                created_at = datetime.fromisoformat(meta["created_at"]) if meta.get("created_at") else None
+
+            # One read + splitlines: no per-line strip() allocation or
+            # buffered-readline overhead; the fast JSON helper parses
+            # the bytes lines directly.
+            for line in path.read_bytes().splitlines():
+                if not line:
+                    continue
+                try:
+                    data = json_loads(line)
+                except ValueError:
+                    # Torn tail line from an interrupted append — skip.
+                    logger.debug(f"Skipping malformed session line in {path.name}")
+                    continue
                     
-                    if data.get("_type") == "metadata":
+                if data.get("_type") == "metadata":
+                    if not metadata:
                         metadata = data.get("metadata", {})
+                    if created_at is None:
                         created_at = datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None
-                    else:
-                        messages.append(data)
+                else:
+                    # Backfill the parsed epoch once at load time so
+                    # context builds never re-parse timestamps.
+                    if "_ts_epoch" not in data and data.get("timestamp"):
+                        try:
+                            data["_ts_epoch"] = datetime.fromisoformat(
+                                data["timestamp"]
+                            ).timestamp()
+                        except (ValueError, TypeError):
+                            pass
+                    messages.append(data)
             
-            return Session(
+            # Keep only the tail in memory; the full file stays intact
+            # as the archive.
+            if len(messages) > Session.MAX_MESSAGES:
+                messages = messages[-Session.MAX_MESSAGES:]
+            session = Session(
                 key=key,
                 messages=messages,
                 created_at=created_at or datetime.now(),
                 metadata=metadata
             )
+            session._persisted_count = len(messages)
+            # Rebuild the exchange index once at load time.
+            session._pair_indices = [
+                (i - 1, i)
+                for i in range(1, len(messages))
+                if messages[i]["role"] == "assistant" and messages[i - 1]["role"] == "user"
+            ]
+            return session
         except Exception as e:
             logger.warning(f"Failed to load session {key}: {e}")
             return None
     
     def save(self, session: Session) -> None:
-        """Save a session to disk."""
+        """Save a session to disk and refresh it in the cache."""
+        self._write(session)
+        if session.key not in self._cache:
+            self._put(session.key, session)
+
+    def _write(self, session: Session) -> None:
+        """Persist a session without touching the cache.
+
+        Messages are append-only: each write serializes only the tail
+        past ``_persisted_count`` and appends it, so per-save cost is
+        O(new messages) instead of rewriting the whole history. The
+        small mutable metadata lives in a sidecar file. A shrunken
+        message list (e.g. after clear()) falls back to a full rewrite.
+
+        Serialized per session key: concurrent writes would read the
+        same ``_persisted_count`` and append the same tail twice.
+        """
+        with self._write_locks.setdefault(session.key, threading.Lock()):
+            self._write_locked(session)
+
+    def _write_locked(self, session: Session) -> None:
         path = self._get_session_path(session.key)
-        
-        with open(path, "w") as f:
-            # Write metadata first
-            metadata_line = {
-                "_type": "metadata",
-                "created_at": session.created_at.isoformat(),
-                "updated_at": session.updated_at.isoformat(),
-                "metadata": session.metadata
-            }
-            f.write(json.dumps(metadata_line) + "\n")
-            
-            # Write messages
-            for msg in session.messages:
-                f.write(json.dumps(msg) + "\n")
-        
-        self._cache[session.key] = session
+
+        # Metadata sidecar — tiny, rewritten every save. Written via a
+        # temp file + atomic rename so a crash mid-write never leaves a
+        # truncated sidecar (same pattern as the LLM dump writer).
+        meta = {
+            "_type": "metadata",
+            "created_at": session.created_at.isoformat(),
+            "updated_at": session.updated_at.isoformat(),
+            "metadata": session.metadata
+        }
+        meta_path = self._get_meta_path(session.key)
+        tmp_path = meta_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(json_dumps_bytes(meta))
+        os.replace(tmp_path, meta_path)
+
+        persisted = session._persisted_count
+        if persisted > len(session.messages) or (persisted and not path.exists()):
+            persisted = 0  # history shrank or file vanished: rewrite
+
+        new_messages = session.messages[persisted:]
+        if new_messages or not persisted:
+            # One buffer, one write call — no per-message boundary
+            # crossings or intermediate string concatenation.
+            buf = b"".join(
+                b for msg in new_messages for b in (json_dumps_bytes(msg), b"\n")
+            )
+            if persisted:
+                with open(path, "ab") as f:
+                    f.write(buf)
+            else:
+                # Full rewrite goes through a temp file + atomic rename.
+                tmp_path = path.with_suffix(".jsonl.tmp")
+                tmp_path.write_bytes(buf)
+                os.replace(tmp_path, path)
+        # Count only what this call actually wrote: the event loop may
+        # have appended (or cleared) while we were writing off-thread,
+        # and stamping len(messages) would mark those as persisted
+        # without ever hitting disk. A clear() racing this write leaves
+        # the count larger than the list, which the shrink check above
+        # turns into a full rewrite on the next save.
+        session._persisted_count = persisted + len(new_messages)
     
+    async def flush_all(self) -> None:
+        """Flush every cached session to disk concurrently.
+
+        Each write runs in a worker thread so K pending flushes overlap
+        on I/O instead of serializing; with append-only saves most are
+        no-ops. Used at shutdown.
+        """
+        sessions = list(self._cache.values())
+        if sessions:
+            await asyncio.gather(
+                *(asyncio.to_thread(self._write, s) for s in sessions)
+            )
+
     def delete(self, key: str) -> bool:
         """
         Delete a session.
@@ -265,39 +450,69 @@ class SessionManager:
         Returns:
             True if deleted, False if not found.
         """
+        # Resolve paths before dropping the memo entry so the lookup
+        # below doesn't repopulate it.
+        path, meta_path = self._get_paths(key)
+
         # Remove from cache
         self._cache.pop(key, None)
-        
-        # Remove file
-        path = self._get_session_path(key)
+        self._path_cache.pop(key, None)
+        self._write_locks.pop(key, None)
+
+        # Remove files
+        meta_path.unlink(missing_ok=True)
         if path.exists():
             path.unlink()
             return True
         return False
     
-    def list_sessions(self) -> list[dict[str, Any]]:
+    def list_sessions(self, detailed: bool = False) -> list[dict[str, Any]]:
         """
         List all sessions.
-        
+
+        The default path is a single directory scan ordered by file
+        mtime — no file is opened. Pass ``detailed=True`` to read each
+        session's metadata (created_at, ISO updated_at) as before.
+
+        Args:
+            detailed: Parse per-session metadata instead of using mtime.
+
         Returns:
-            List of session info dicts.
+            List of session info dicts, most recently updated first.
         """
         sessions = []
-        
+
+        if not detailed:
+            with os.scandir(self.sessions_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(".jsonl"):
+                        continue
+                    sessions.append({
+                        "key": entry.name[:-6].replace("_", ":"),
+                        "updated_at": entry.stat().st_mtime,
+                        "path": entry.path,
+                    })
+            sessions.sort(key=lambda x: x["updated_at"], reverse=True)
+            return sessions
+
         for path in self.sessions_dir.glob("*.jsonl"):
             try:
-                # Read just the metadata line
-                with open(path) as f:
-                    first_line = f.readline().strip()
-                    if first_line:
-                        data = json.loads(first_line)
-                        if data.get("_type") == "metadata":
-                            sessions.append({
-                                "key": path.stem.replace("_", ":"),
-                                "created_at": data.get("created_at"),
-                                "updated_at": data.get("updated_at"),
-                                "path": str(path)
-                            })
+                # Prefer the metadata sidecar; legacy files carry the
+                # metadata inline as their first line.
+                meta_path = path.with_suffix(".meta.json")
+                if meta_path.exists():
+                    data = json_loads(meta_path.read_bytes())
+                else:
+                    with open(path, "rb") as f:
+                        first_line = f.readline().strip()
+                    data = json_loads(first_line) if first_line else {}
+                if data.get("_type") == "metadata":
+                    sessions.append({
+                        "key": path.stem.replace("_", ":"),
+                        "created_at": data.get("created_at"),
+                        "updated_at": data.get("updated_at"),
+                        "path": str(path)
+                    })
             except Exception:
                 continue
         
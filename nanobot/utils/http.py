@@ -0,0 +1,54 @@
+"""Shared httpx client — one connection pool per event loop.
+
+Every outbound HTTP caller (gateway tools, webhook emitter, task-list
+syncs) shares a single AsyncClient so DNS cache, TLS sessions and
+keep-alive connections are paid for once per process instead of once
+per component.
+"""
+
+import asyncio
+import weakref
+
+import httpx
+
+# HTTP/2 lets concurrent calls multiplex one TLS connection; fall back
+# to HTTP/1.1 if the h2 extra isn't installed.
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+# Shared connection pool settings. Under HTTP/2, max_connections is
+# effectively a stream cap on the shared connection.
+_CLIENT_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+)
+_CLIENT_TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+
+# One client per event loop (weak keys so a finished loop doesn't pin
+# its client). Callers needing a tighter deadline pass timeout= per
+# request rather than building their own client.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=_CLIENT_LIMITS, timeout=_CLIENT_TIMEOUT, http2=_HTTP2
+        )
+        _clients[loop] = client
+    return client
+
+
+async def aclose_shared_client() -> None:
+    """Close the shared client for the running loop (process shutdown)."""
+    loop = asyncio.get_running_loop()
+    client = _clients.pop(loop, None)
+    if client is not None and not client.is_closed:
+        await client.aclose()